@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Profiled benchmark harness for the quantum/morphological pipelines
+
+Runs omega_pipeline, transducer_pipeline, morphological_pipeline and the
+tree builders from src/merktree.py, librarytrial.py and skiquanttrial.py
+across input sizes. Per case it reports throughput, p50/p99 wall time over
+the iterations (p99 only from TAIL_MIN_SAMPLES iterations up; it is "n/a"
+and null in the JSON below that) and peak traced memory (tracemalloc, measured in a separate
+run so it does not skew the timings). Results are stored as JSON and can be
+compared against a previous run.
+
+    python -m benchmarks.pipelines --sizes 1e3 1e4 1e5 --output bench.json
+    python -m benchmarks.pipelines --sizes 1e3 1e4 1e5 --baseline bench.json
+"""
+
+import gc
+import sys
+import json
+import math
+import time
+import argparse
+import platform
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import librarytrial
+import skiquanttrial
+from src import merktree
+from src.handle import Benchmark, format_seconds, percentile, tail_percentile
+
+# A case builds its inputs for size n and returns the zero-argument call to time
+CaseFactory = Callable[[int], Callable[[], Any]]
+
+TRANSFORMATIONS = [
+    lambda s: s.upper(),
+    lambda s: s[::-1],
+    lambda s: s.replace('E', '@'),
+]
+
+def _omega(module) -> CaseFactory:
+    def build(n: int) -> Callable[[], Any]:
+        omega = list(range(n))
+        return lambda: module.omega_pipeline(omega, lambda x: x * 3, lambda x: abs(math.cos(x)))
+    return build
+
+def _transducer(module) -> CaseFactory:
+    def build(n: int) -> Callable[[], Any]:
+        data = list(range(n))
+        return lambda: module.transducer_pipeline(data, lambda x: abs(math.cos(x)), module.QuantumProcessor())
+    return build
+
+def _morphological(n: int) -> Callable[[], Any]:
+    data = [f"item-{i % 1000}" for i in range(n)]
+    return lambda: librarytrial.morphological_pipeline(data, TRANSFORMATIONS, len)
+
+def _tree(module, unique: bool = False) -> CaseFactory:
+    """Tree build over duplicate-heavy leaves (1000 distinct) or all-distinct ones."""
+    def build(n: int) -> Callable[[], Any]:
+        data = [f"leaf-{i if unique else i % 1000}" for i in range(n)]
+        def run() -> Any:
+            cache = getattr(module, "TransformChain", None)
+            if cache is not None:
+                cache.results.clear()  # every iteration starts cold
+            return module.MorphologicalTree(data, TRANSFORMATIONS)
+        return run
+    return build
+
+def _stream(n: int) -> Callable[[], Any]:
+    def run() -> None:
+        for _ in merktree.stream_pipeline(range(n), lambda x: (x % 7) / 7, lambda x: x * 3):
+            pass
+    return run
+
+PIPELINES: Dict[str, CaseFactory] = {
+    "merktree.omega_pipeline": _omega(merktree),
+    "merktree.transducer_pipeline": _transducer(merktree),
+    "merktree.stream_pipeline": _stream,
+    "merktree.MorphologicalTree": _tree(merktree),
+    "merktree.MorphologicalTree[unique]": _tree(merktree, unique=True),
+    "librarytrial.morphological_pipeline": _morphological,
+    "skiquanttrial.omega_pipeline": _omega(skiquanttrial),
+    "skiquanttrial.transducer_pipeline": _transducer(skiquanttrial),
+    "skiquanttrial.MorphologicalTree": _tree(skiquanttrial),
+}
+
+class PipelineBenchmark(Benchmark):
+    """Benchmark of an in-process pipeline across input sizes."""
+    def __init__(self, name: str, factory: CaseFactory, sizes: Sequence[int],
+                 iterations: int = 5, profile: bool = False):
+        super().__init__([name], iterations)
+        self.name = name
+        self.factory = factory
+        self.sizes = list(sizes)
+        self.profile = profile
+
+    def _peak_memory(self, call: Callable[[], Any]) -> int:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            call()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def run_size(self, n: int) -> Dict[str, Any]:
+        call = self.factory(n)
+        call()  # warm-up
+        samples = []
+        for _ in range(self.iterations):
+            gc.collect()
+            t0 = time.perf_counter()
+            call()
+            samples.append(time.perf_counter() - t0)
+        self.results.extend(samples)
+        p50 = percentile(samples, 50)
+        return {
+            "pipeline": self.name,
+            "size": n,
+            "iterations": self.iterations,
+            "mean_s": sum(samples) / len(samples),
+            "p50_s": p50,
+            "p99_s": tail_percentile(samples, 99),  # null below TAIL_MIN_SAMPLES iterations
+            "throughput_per_s": n / p50 if p50 else float("inf"),
+            "peak_bytes": self._peak_memory(call),
+        }
+
+    def run(self) -> List[Dict[str, Any]]:
+        rows = []
+        if self.profile:
+            self.profiler.start()
+        try:
+            for n in self.sizes:
+                row = self.run_size(n)
+                rows.append(row)
+                print(f"{self.name:<38} n={n:<9} p50={row['p50_s']:.4f}s p99={format_seconds(row['p99_s'], 4)} "
+                      f"{row['throughput_per_s']:>12.0f}/s peak={row['peak_bytes'] / 1e6:.1f}MB")
+        finally:
+            if self.profile:
+                print(self.profiler.stop())
+        return rows
+
+def compare(rows: List[Dict[str, Any]], baseline: Dict[str, Any]) -> None:
+    """Print the p50 change of every case also present in the baseline."""
+    previous = {(row["pipeline"], row["size"]): row for row in baseline.get("results", [])}
+    print('_' * 80)
+    print(f"{'pipeline':<38} {'size':>9} {'p50 old':>10} {'p50 new':>10} {'change':>8}")
+    for row in rows:
+        old = previous.get((row["pipeline"], row["size"]))
+        if old is None:
+            continue
+        change = (row["p50_s"] - old["p50_s"]) / old["p50_s"] * 100 if old["p50_s"] else 0.0
+        print(f"{row['pipeline']:<38} {row['size']:>9} {old['p50_s']:>10.4f} {row['p50_s']:>10.4f} {change:>+7.1f}%")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the quantum/morphological pipelines')
+    parser.add_argument('--sizes', nargs='+', type=float, default=[1e3, 1e4, 1e5],
+                        help="Input sizes (1e3 .. 1e7)")
+    parser.add_argument('-n', '--num', type=int, default=5, help="Timed iterations per size (p99 is reported from 100 up)")
+    parser.add_argument('--only', nargs='+', choices=sorted(PIPELINES), help="Pipelines to run")
+    parser.add_argument('--profile', action='store_true', help="Print cProfile data per pipeline")
+    parser.add_argument('--output', help="Write results to this JSON file")
+    parser.add_argument('--baseline', help="Compare against a previous JSON result file")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes]
+    rows: List[Dict[str, Any]] = []
+    for name in args.only or PIPELINES:
+        rows.extend(PipelineBenchmark(name, PIPELINES[name], sizes, args.num, args.profile).run())
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            compare(rows, json.load(f))
+    if args.output:
+        report = {
+            "meta": {
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "results": rows,
+        }
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the main.py and src/handle.py command lines
+
+Runs each subcommand in a fresh interpreter under ``-X importtime`` and
+reports the median wall time, the total time spent importing, the number of
+modules loaded and the heaviest top-level imports. External tools (uv, uvx)
+are replaced by no-op stubs on PATH and the project root is a scratch copy,
+so the numbers are the CLI's own startup overhead. Results are stored as JSON
+and can be compared against a previous run.
+
+    python -m benchmarks.startup --output startup.json
+    python -m benchmarks.startup --baseline startup.json
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+REPO = Path(__file__).resolve().parents[1]
+
+def commands(scratch: Path) -> Dict[str, List[str]]:
+    """Subcommand name -> argv (after the interpreter) run from ``scratch``"""
+    main = [str(REPO / "main.py"), "--root", str(scratch)]
+    handle = [str(REPO / "src" / "handle.py")]
+    return {
+        "main --help": [str(REPO / "main.py"), "--help"],
+        "main setup": [*main, "setup"],
+        "main run": [*main, "run", str(scratch / "job.py")],
+        "main run-many": [*main, "run-many", str(scratch / "jobs.txt"), "-j", "1"],
+        "main test": [*main, "test"],
+        "main lint": [*main, "lint"],
+        "main format": [*main, "format"],
+        "handle --help": [*handle, "--help"],
+        "handle command": [*handle, "-n", "1", "--", "true"],
+        "handle --func": [*handle, "--func", "time:time", "-n", "1", "--loops", "1", "--warmup", "0"],
+    }
+
+def make_scratch(root: Path) -> Dict[str, str]:
+    """Populate a scratch project and return an environment with stubbed tools"""
+    for name in ("pyproject.toml", "demiurge.json"):
+        shutil.copy(REPO / name, root / name)
+    (root / "job.py").write_text("pass\n")
+    (root / "jobs.txt").write_text(f"{root / 'job.py'}\n")
+    bin_dir = root / "bin"
+    bin_dir.mkdir()
+    for tool in ("uv", "uvx"):
+        stub = bin_dir / tool
+        stub.write_text("#!/bin/sh\nexit 0\n")
+        stub.chmod(0o755)
+    env = dict(os.environ)
+    env["PATH"] = f"{bin_dir}{os.pathsep}{env.get('PATH', '')}"
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    return env
+
+def parse_importtime(stderr: str) -> Tuple[float, int, List[Tuple[str, float]]]:
+    """Total self import time (s), module count and top-level imports by cumulative time"""
+    total = 0
+    count = 0
+    top_level = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # header
+        total += int(self_us)
+        count += 1
+        if not name.startswith("  "):
+            top_level.append((name.strip(), int(cumulative_us) / 1e6))
+    top_level.sort(key=lambda item: item[1], reverse=True)
+    return total / 1e6, count, top_level
+
+def measure(name: str, argv: List[str], cwd: Path, env: Dict[str, str], repeat: int) -> Dict[str, Any]:
+    walls = []
+    imports = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        proc = subprocess.run([sys.executable, "-X", "importtime", *argv], cwd=cwd, env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        walls.append(time.perf_counter() - t0)
+        imports.append(parse_importtime(proc.stderr))
+    import_s, modules, top_level = imports[-1]
+    return {
+        "command": name,
+        "repeat": repeat,
+        "wall_median_s": statistics.median(walls),
+        "wall_min_s": min(walls),
+        "import_s": statistics.median(i[0] for i in imports),
+        "modules": modules,
+        "top_imports": top_level[:5],
+    }
+
+def compare(rows: List[Dict[str, Any]], baseline: Dict[str, Any]) -> None:
+    """Print the median wall-time change of every command also present in the baseline."""
+    previous = {row["command"]: row for row in baseline.get("results", [])}
+    print('_' * 80)
+    print(f"{'command':<18} {'old':>9} {'new':>9} {'change':>8} {'imports old/new':>18}")
+    for row in rows:
+        old = previous.get(row["command"])
+        if old is None:
+            continue
+        change = (row["wall_median_s"] - old["wall_median_s"]) / old["wall_median_s"] * 100
+        print(f"{row['command']:<18} {old['wall_median_s'] * 1e3:>7.1f}ms {row['wall_median_s'] * 1e3:>7.1f}ms "
+              f"{change:>+7.1f}% {old['modules']:>8}/{row['modules']:<8}")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Cold-start time per CLI subcommand')
+    parser.add_argument('-n', '--repeat', type=int, default=10, help="Fresh interpreters per command")
+    parser.add_argument('--only', nargs='+', help="Commands to run (e.g. 'main run')")
+    parser.add_argument('--output', help="Write results to this JSON file")
+    parser.add_argument('--baseline', help="Compare against a previous JSON result file")
+    args = parser.parse_args(argv)
+
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="startup-bench-") as tmp:
+        scratch = Path(tmp)
+        env = make_scratch(scratch)
+        for name, command in commands(scratch).items():
+            if args.only and name not in args.only:
+                continue
+            row = measure(name, command, scratch, env, args.repeat)
+            rows.append(row)
+            heaviest = ", ".join(f"{mod} {sec * 1e3:.1f}ms" for mod, sec in row["top_imports"][:3])
+            print(f"{name:<18} {row['wall_median_s'] * 1e3:>7.1f}ms wall  {row['import_s'] * 1e3:>6.1f}ms "
+                  f"importing {row['modules']:>4} modules  [{heaviest}]")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            compare(rows, json.load(f))
+    if args.output:
+        report = {
+            "meta": {
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "results": rows,
+        }
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for MorphologicalTree.build_tree
+
+Builds the same tree with 1, 2, 4, ... N worker processes and reports the
+best wall time, speedup over the serial builder, and whether every run
+produced the serial root hash.
+
+    python -m benchmarks.tree_build --leaves 1000000 --repeat 3
+"""
+
+import os
+import sys
+import time
+import argparse
+from typing import List, Optional
+
+from src.merktree import MorphologicalNode, MorphologicalTree
+
+def worker_counts(max_workers: int) -> List[int]:
+    """1, 2, 4, ... up to and including ``max_workers``."""
+    counts, n = [], 1
+    while n < max_workers:
+        counts.append(n)
+        n *= 2
+    counts.append(max_workers)
+    return counts
+
+def time_build(leaves: List[MorphologicalNode], workers: int, repeat: int) -> tuple[float, str]:
+    """Best-of-``repeat`` build time and the resulting root hash."""
+    tree = MorphologicalTree.__new__(MorphologicalTree)
+    best, root = float('inf'), ''
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        root = tree.build_tree(leaves, max_workers=workers).hash
+        best = min(best, time.perf_counter() - t0)
+    return best, root
+
+def run(num_leaves: int, max_workers: Optional[int] = None, repeat: int = 3) -> List[dict]:
+    max_workers = max_workers or os.cpu_count() or 1
+    leaves = [MorphologicalNode(f"leaf-{i}") for i in range(num_leaves)]
+    rows, serial_time, serial_root = [], None, None
+    for workers in worker_counts(max_workers):
+        seconds, root = time_build(leaves, workers, repeat)
+        if serial_time is None:
+            serial_time, serial_root = seconds, root
+        rows.append({
+            "workers": workers,
+            "seconds": seconds,
+            "speedup": serial_time / seconds,
+            "root_matches": root == serial_root,
+        })
+    return rows
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='MorphologicalTree build scaling benchmark')
+    parser.add_argument('--leaves', type=int, default=1 << 20, help="Number of leaves")
+    parser.add_argument('--max-workers', type=int, default=None, help="Largest worker count (default: CPU count)")
+    parser.add_argument('--repeat', type=int, default=3, help="Builds per worker count (best is reported)")
+    args = parser.parse_args()
+
+    rows = run(args.leaves, args.max_workers, args.repeat)
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8} {'root':>6}")
+    for row in rows:
+        print(f"{row['workers']:>8} {row['seconds']:>10.3f} {row['speedup']:>7.2f}x "
+              f"{'ok' if row['root_matches'] else 'DIFF':>6}")
+    return 0 if all(row['root_matches'] for row in rows) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,10 +20,12 @@ from typing import (
     Any, Callable, TypeVar, Generic, List, Optional, Protocol
 )
 from dataclasses import dataclass, field
-from collections import deque
 from functools import partial
 from contextlib import contextmanager
 
+from src import ski as ski_graph
+from src.merktree import MaxwellDemon, TransformChain  # shared batch sorter and memoized chains
+
 # Generic Type Variables
 T = TypeVar('T')
 S = TypeVar('S')
@@ -101,44 +103,48 @@ class SKICombinator:
         """
         return x
 
-# Maxwell's Demon-inspired Energy Sorting Mechanism
-class MaxwellDemon:
-    """
-    Information sorting mechanism inspired by Maxwell's Demon concept.
-    Categorizes particles based on energy thresholds.
-    """
-    def __init__(self, energy_threshold: float = 0.5):
+    # Term-graph API: programs as SKI graphs reduced by a shared machine
+    machine = ski_graph.SKIMachine()
+
+    @staticmethod
+    def term(source: str, **env: Any) -> ski_graph.Node:
         """
-        Initialize the Maxwell Demon with an energy threshold.
+        Compile a lambda-style expression into an SKI term graph.
         
         Args:
-            energy_threshold: Threshold for categorizing particles
+            source: Expression such as "\\x y. x"
+            **env: Python values or functions bound to free names
+        
+        Returns:
+            Term graph ready for reduction
         """
-        self.energy_threshold = energy_threshold
-        self.high_energy = deque()
-        self.low_energy = deque()
+        return ski_graph.translate(source, env)
 
-    def sort(self, particle: Any, energy: float) -> None:
+    def reduce(self, term: ski_graph.Node, max_steps: Optional[int] = None) -> ski_graph.Node:
         """
-        Sort a particle into high or low energy collections.
+        Graph-reduce a term to normal form, memoized by term hash.
         
         Args:
-            particle: Item to be sorted
-            energy: Energy value of the particle
+            term: Term graph (rewritten in place)
+            max_steps: Optional reduction budget
+        
+        Returns:
+            Normal form of the term
         """
-        if energy > self.energy_threshold:
-            self.high_energy.append(particle)
-        else:
-            self.low_energy.append(particle)
+        return self.machine.reduce(term, max_steps)
 
-    def get_sorted(self) -> tuple[deque, deque]:
+    def evaluate(self, term: ski_graph.Node, max_steps: Optional[int] = None) -> Any:
         """
-        Retrieve sorted particle collections.
+        Reduce a term and unwrap a literal result.
+        
+        Args:
+            term: Term graph (rewritten in place)
+            max_steps: Optional reduction budget
         
         Returns:
-            Tuple of high and low energy collections
+            Python value of the normal form, or the term itself
         """
-        return self.high_energy, self.low_energy
+        return self.machine.evaluate(term, max_steps)
 
 # Quantum Processor for State Manipulation
 class QuantumProcessor:
@@ -163,15 +169,14 @@ class QuantumProcessor:
         Returns:
             Transformed data
         """
-        def transformed_func(x):
-            transformed = transform(x)
-            return lambda _: transformed
-
-        return self.ski.S(
-            transformed_func,  # First function
-            self.ski.I,        # Second function (identity)
-            data               # Input data
+        term = ski_graph.app(
+            ski_graph.S,                                            # S
+            ski_graph.app(ski_graph.K, ski_graph.prim(transform)),  # K transform
+            ski_graph.I,                                            # I
+            ski_graph.lit(data)                                     # Input data
         )
+        # primitive terms are never memoized, so skip hashing and normalize directly
+        return ski_graph.to_python(self.ski.machine.normalize(term))
 
     def measure(self, quantum_state: QuantumState) -> T:
         """
@@ -239,16 +244,15 @@ class MorphologicalNode:
         """
         Apply morphing operations to transform the node's data.
         """
-        for operation in self.morph_operations:
-            self.data = operation(self.data)
+        self.data = TransformChain.compile(self.morph_operations).apply(self.data)[0]
 
     def reflect_and_morph(self) -> None:
         """
-        Execute self-modifications and update hash.
+        Execute self-modifications and update hash, memoized per chain and input.
         """
         if self.morph_operations:
-            self.morph()
-            self.hash = self._calculate_hash(self.data)
+            chain = TransformChain.compile(self.morph_operations)
+            self.data, self.hash = chain.apply(self.data)
 
 # Utility Functions for Hash and Color Generation
 def hash_data(data: str) -> str:
@@ -305,9 +309,7 @@ def morphological_pipeline(
     measured_state = processor.measure(quantum_state)
     
     # Sort using Maxwell's Demon
-    for item in data:
-        energy = energy_function(item)
-        processor.demon.sort(item, energy)
+    processor.demon.sort_batch(data, energy_function)
     
     # Apply transformations
     transformed_data = [
@@ -5,67 +5,128 @@ from __future__ import annotations
 #------------------------------------------------------------------------------
 # Standard Library Imports - 3.13 std libs **ONLY**
 #------------------------------------------------------------------------------
-import re
-import os
+# Only what defining this module needs is imported up front. Everything else
+# is a LazyModule that imports on first use, so each subcommand pays only for
+# the modules it touches (``python -m benchmarks.startup`` tracks this).
 import io
-import dis
+import os
 import sys
-import ast
 import time
-import site
-import mmap
-import json
-import uuid
-import shlex
-import socket
-import struct
-import shutil
-import pickle
-import ctypes
-import logging
-import tomllib
-import pathlib
-import asyncio
-import inspect
-import hashlib
-import tempfile
-import platform
-import traceback
-import functools
-import linecache
-import importlib
-import threading
-import subprocess
-import tracemalloc
-import http.server
-import collections
-from array import array
-from pathlib import Path, PureWindowsPath
-from enum import Enum, auto
-from collections.abc import Iterable, Mapping
-from datetime import datetime
-from queue import Queue, Empty
-from abc import ABC, abstractmethod
-from functools import reduce, lru_cache, partial, wraps
+from pathlib import Path
+from functools import partial
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor
-from contextlib import contextmanager, asynccontextmanager
-from importlib.util import spec_from_file_location, module_from_spec
-from types import (
-    SimpleNamespace, ModuleType, MethodType, 
-    FunctionType, CodeType, TracebackType, FrameType
-)
 from typing import (
-    Any, Dict, List, Optional, Union, Callable, TypeVar, 
-    Tuple, Generic, Set, Coroutine, Type, NamedTuple, 
-    ClassVar, Protocol, runtime_checkable, AsyncIterator
+    Any, Dict, List, Optional, Union, Callable, Tuple, Coroutine, Iterable, Set
 )
-import cProfile
-import pstats
-import argparse
-from io import StringIO
-import signal
-import errno
+
+def _load_lazymodule():
+    """Load src/lazymodule.py by path: importing ``src.lazymodule`` would run the
+    src package's logging setup on every CLI call, and it needs no siblings"""
+    from importlib.util import module_from_spec, spec_from_file_location
+    spec = spec_from_file_location("_demiurge_lazymodule",
+                                   Path(__file__).resolve().parent / "src" / "lazymodule.py")
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+LazyModule = _load_lazymodule().LazyModule
+
+asyncio = LazyModule("asyncio", globals())
+fcntl = LazyModule("fcntl", globals())
+hashlib = LazyModule("hashlib", globals())
+json = LazyModule("json", globals())
+logging = LazyModule("logging", globals())
+platform = LazyModule("platform", globals())
+selectors = LazyModule("selectors", globals())
+shlex = LazyModule("shlex", globals())
+signal = LazyModule("signal", globals())
+socket = LazyModule("socket", globals())
+struct = LazyModule("struct", globals())
+subprocess = LazyModule("subprocess", globals())
+tempfile = LazyModule("tempfile", globals())
+threading = LazyModule("threading", globals())
+tomllib = LazyModule("tomllib", globals())
+
+_BARE_KEY = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-")
+
+def _toml_key(key: str) -> str:
+    return key if key and set(key) <= _BARE_KEY else _toml_string(key)
+
+def _toml_string(value: str) -> str:
+    escaped = []
+    for char in value:
+        if char in '"\\':
+            escaped.append('\\' + char)
+        elif char == '\n':
+            escaped.append('\\n')
+        elif char == '\t':
+            escaped.append('\\t')
+        elif char < ' ' or char == '\x7f':
+            escaped.append(f'\\u{ord(char):04x}')
+        else:
+            escaped.append(char)
+    return '"' + ''.join(escaped) + '"'
+
+def _toml_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if value != value:
+            return "nan"
+        if value in (float("inf"), float("-inf")):
+            return "inf" if value > 0 else "-inf"
+        return repr(value)
+    if isinstance(value, (str, Path)):
+        return _toml_string(str(value))
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_toml_value(item) for item in value) + "]"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{_toml_key(k)} = {_toml_value(v)}" for k, v in value.items()) + "}"
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Cannot represent {type(value).__name__} in TOML: {value!r}")
+
+def _is_table_array(value: Any) -> bool:
+    return isinstance(value, list) and bool(value) and all(isinstance(item, dict) for item in value)
+
+def dump_toml(data: Dict[str, Any]) -> str:
+    """Serialize nested dicts to TOML (the stdlib ``tomllib`` only reads)
+
+    Dicts become ``[tables]``, lists of dicts ``[[arrays of tables]]``, and
+    everything else an inline value. ``None`` has no TOML form, so such keys
+    are omitted.
+    """
+    lines: List[str] = []
+
+    def emit(table: Dict[str, Any], path: List[str], header: Optional[str]) -> None:
+        scalars = [(k, v) for k, v in table.items()
+                   if v is not None and not isinstance(v, dict) and not _is_table_array(v)]
+        if header and (scalars or not any(isinstance(v, dict) or _is_table_array(v)
+                                          for v in table.values())):
+            lines.append(header)
+        for key, value in scalars:
+            lines.append(f"{_toml_key(key)} = {_toml_value(value)}")
+        if lines and lines[-1]:
+            lines.append("")
+        for key, value in table.items():
+            dotted = ".".join(_toml_key(part) for part in [*path, key])
+            if isinstance(value, dict):
+                emit(value, [*path, key], f"[{dotted}]")
+            elif _is_table_array(value):
+                for item in value:
+                    lines.append(f"[[{dotted}]]")
+                    emit(item, [*path, key], None)
+                    if lines[-1]:
+                        lines.append("")
+
+    emit(data, [], None)
+    while lines and not lines[-1]:
+        lines.pop()
+    return "\n".join(lines) + "\n"
+
 @dataclass
 class ProjectConfig:
     """Project configuration container"""
@@ -79,13 +140,630 @@ class ProjectConfig:
     src_path: Path = Path("src")
     tests_path: Path = Path("tests")
 
+@dataclass
+class Job:
+    """One ``run-many`` manifest entry"""
+    module_path: str
+    args: List[str] = field(default_factory=list)
+    timeout: Optional[float] = None
+    retries: Optional[int] = None
+    id: Optional[str] = None
+
+def load_manifest(path: str) -> List[Job]:
+    """Read jobs from a JSON list, JSON lines, or plain ``module_path args...`` lines ("-" is stdin)
+
+    JSON entries are objects with ``module_path`` (or ``path``) and optional
+    ``args``, ``timeout``, ``retries`` and ``id``; a bare string is a path.
+    """
+    text = sys.stdin.read() if path == "-" else Path(path).read_text()
+    stripped = text.lstrip()
+    if stripped.startswith("["):
+        entries = json.loads(stripped)
+    else:
+        entries = []
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("{"):
+                entries.append(json.loads(line))
+            else:
+                module_path, *args = shlex.split(line)
+                entries.append({"module_path": module_path, "args": args})
+    jobs = []
+    for index, entry in enumerate(entries):
+        if isinstance(entry, str):
+            entry = {"module_path": entry}
+        jobs.append(Job(
+            module_path=entry.get("module_path") or entry["path"],
+            args=[str(arg) for arg in entry.get("args", [])],
+            timeout=entry.get("timeout"),
+            retries=entry.get("retries"),
+            id=str(entry.get("id", index)),
+        ))
+    return jobs
+
+@dataclass
+class SetupStage:
+    """A node of the setup DAG; ``action`` returns False when it skipped its work"""
+    name: str
+    action: Callable[[], Coroutine[Any, Any, Any]]
+    after: Tuple[str, ...] = ()
+
+async def run_stages(stages: List[SetupStage]) -> Dict[str, Optional[float]]:
+    """Run stages concurrently, each once everything in its ``after`` has finished
+
+    Dependencies on stages absent from ``stages`` are treated as satisfied. The
+    first failure cancels the stages still pending and is re-raised. Returns
+    wall time per stage, or ``None`` for stages that reported a skip.
+    """
+    tasks: Dict[str, asyncio.Task] = {}
+    timings: Dict[str, Optional[float]] = {}
+    names = {stage.name for stage in stages}
+
+    async def run(stage: SetupStage) -> None:
+        await asyncio.gather(*(tasks[name] for name in stage.after if name in names))
+        t0 = time.perf_counter()
+        ran = await stage.action()
+        timings[stage.name] = None if ran is False else time.perf_counter() - t0
+
+    pending = list(stages)
+    while pending:  # create tasks in dependency order so every awaited task exists
+        ready = [s for s in pending if all(n in tasks or n not in names for n in s.after)]
+        if not ready:
+            raise ValueError(f"Dependency cycle among stages: {[s.name for s in pending]}")
+        for stage in ready:
+            tasks[stage.name] = asyncio.create_task(run(stage))
+            pending.remove(stage)
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+    return {stage.name: timings.get(stage.name) for stage in stages}
+
+_FORKSERVER_SOURCE = r"""
+import os, sys, json, socket, signal, struct, runpy, importlib, traceback
+
+STALE = -1
+
+def preload(root, modules):
+    sys.path.insert(0, root)  # project modules are named src.*, never by their bare file name
+    files = {}
+    for name in modules:
+        try:
+            module = importlib.import_module(name)
+        except ModuleNotFoundError as e:  # e.g. an optional heavy dependency
+            print(f'preload: {e}', file=sys.stderr)
+            continue
+        except Exception:
+            traceback.print_exc()
+            continue
+        path = getattr(module, '__file__', None)
+        if path:
+            files[path] = os.stat(path).st_mtime_ns
+    return files
+
+def stale(files):
+    try:
+        return any(os.stat(path).st_mtime_ns != mtime for path, mtime in files.items())
+    except OSError:
+        return True
+
+def child(conn, fds, request, base_path):
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+        os.close(fd)
+    os.chdir(request['cwd'])
+    os.environ.clear()
+    os.environ.update(request['env'])
+    path = request['path']
+    sys.argv = [path, *request['args']]
+    sys.path[:] = [os.path.dirname(os.path.abspath(path)), *base_path]
+    if 'random' in sys.modules:
+        sys.modules['random'].seed()
+    conn.sendall(struct.pack('!q', os.getpid()))
+    code = 0
+    try:
+        runpy.run_path(path, run_name='__main__')
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            code = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except Exception:
+            pass
+    conn.sendall(struct.pack('!q', code))
+    os._exit(code & 0xff)
+
+def serve(sock_path, root, idle_timeout, modules):
+    # stdout is the readiness pipe; anything printed by imports or children goes to stderr
+    ready = os.dup(1)
+    os.dup2(2, 1)
+    base_path = [p for p in sys.path if p]
+    files = preload(root, modules)
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)  # children are reaped automatically
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(sock_path)
+    server.listen(64)
+    server.settimeout(idle_timeout)
+    os.write(ready, b'ready\n')
+    os.close(ready)
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                break
+            with conn:
+                conn.settimeout(None)
+                message, fds, _, _ = socket.recv_fds(conn, 1 << 20, 3)
+                if not message:  # a liveness probe
+                    for fd in fds:
+                        os.close(fd)
+                    continue
+                if stale(files):
+                    # stop accepting before replying so a retrying client starts a new server
+                    server.close()
+                    os.unlink(sock_path)
+                    conn.sendall(struct.pack('!q', STALE))
+                    break
+                sys.stdout.flush()
+                sys.stderr.flush()
+                if os.fork() == 0:
+                    server.close()
+                    child(conn, fds, json.loads(message), base_path)
+                for fd in fds:
+                    os.close(fd)
+    finally:
+        server.close()
+        try:
+            os.unlink(sock_path)
+        except FileNotFoundError:
+            pass
+
+serve(sys.argv[1], sys.argv[2], float(sys.argv[3]), sys.argv[4:])
+"""
+
+class ForkServer:
+    """Pre-warmed interpreter that forks one child per run (POSIX only)
+
+    The server process imports an explicit list of modules once (see
+    ``ProjectManager.FORK_SERVER_PRELOAD``) and then listens on a unix
+    socket. Each run passes stdin and fresh stdout/stderr
+    pipes over the socket; the server forks, and the child executes the
+    script with ``runpy`` in a clean ``__main__`` namespace. The server
+    outlives the CLI invocation so repeated ``main.py run`` calls skip
+    interpreter startup and imports, exits after ``idle_timeout`` seconds
+    without requests, and restarts itself when a preloaded source file
+    changes.
+
+    The socket and log live in a per-user 0700 directory (under
+    ``$XDG_RUNTIME_DIR`` when set), and the client checks that the socket
+    and the process behind it belong to the current user before sending
+    its environment and file descriptors.
+    """
+    STALE = -1
+    BUFFER_SIZE = 65536
+
+    def __init__(self, root: Path, preload: List[str], idle_timeout: float = 600.0,
+                 python: str = sys.executable):
+        self.root = root.resolve()
+        self.preload = preload
+        self.idle_timeout = idle_timeout
+        self.python = python
+        # AF_UNIX paths are limited to ~100 bytes, so key the socket by root instead of nesting it there
+        key = hashlib.sha1(str(self.root).encode()).hexdigest()[:12]
+        self.socket_path = self._private_dir() / f"forkserver-{key}.sock"
+        self.log_path = self.socket_path.with_suffix(".log")
+        self.lock_path = self.socket_path.with_suffix(".lock")
+        self._start_lock = threading.Lock()
+
+    @staticmethod
+    def _private_dir() -> Path:
+        """A directory only the current user can enter, created on first use"""
+        import stat
+        runtime = os.environ.get("XDG_RUNTIME_DIR")
+        if runtime:
+            path = Path(runtime) / "demiurge"
+        else:
+            path = Path(tempfile.gettempdir()) / f"demiurge-{os.getuid()}"
+        try:
+            path.mkdir(mode=0o700)
+        except FileExistsError:
+            pass
+        st = path.lstat()
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+            raise RuntimeError(f"Refusing to use {path} for the fork server: "
+                               "it is not a private directory owned by this user")
+        return path
+
+    @staticmethod
+    def supported() -> bool:
+        return hasattr(os, "fork") and hasattr(socket, "send_fds")
+
+    @contextmanager
+    def _startup_lock(self):
+        """Serialize server startup across threads (``run_many``) and processes"""
+        with self._start_lock:
+            fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                os.close(fd)  # releases the flock
+
+    def start(self) -> None:
+        """Spawn the server, unless a live one already answers on the socket"""
+        with self._startup_lock():
+            # whoever held the lock before us may have just started one
+            sock = self._connect()
+            if sock is not None:
+                sock.close()
+                return
+            # nothing is listening, so whatever is left at the path belongs to a dead server
+            self.socket_path.unlink(missing_ok=True)
+            self._spawn()
+
+    def _spawn(self) -> None:
+        # the server outlives us, so it must not hold our stderr open
+        with open(self.log_path, "ab") as log:
+            process = subprocess.Popen(
+                [self.python, "-c", _FORKSERVER_SOURCE, str(self.socket_path), str(self.root),
+                 str(self.idle_timeout), *self.preload],
+                cwd=self.root, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=log,
+                start_new_session=True,
+            )
+        ready = process.stdout.readline()
+        process.stdout.close()
+        if ready.strip() != b"ready":
+            raise RuntimeError(f"Fork server failed to start (exit status {process.wait()}, "
+                               f"see {self.log_path})")
+
+    def _connect(self) -> Optional[socket.socket]:
+        """Connect to a live server owned by this user; ``None`` if nothing is listening"""
+        try:
+            owner = self.socket_path.lstat().st_uid
+        except FileNotFoundError:
+            return None
+        if owner != os.getuid():
+            raise RuntimeError(f"{self.socket_path} belongs to uid {owner}, not to this user")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(str(self.socket_path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            sock.close()
+            return None
+        if hasattr(socket, "SO_PEERCRED"):  # Linux; elsewhere the private directory has to do
+            creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+            _, uid, _ = struct.unpack("3i", creds)
+            if uid != os.getuid():
+                sock.close()
+                raise RuntimeError(f"Fork server socket {self.socket_path} is served by uid {uid}")
+        return sock
+
+    def _submit(self, request: Dict[str, Any]) -> Tuple[socket.socket, int, int, int]:
+        """Send a run request; returns the connection, the child pid and our pipe ends"""
+        for _ in range(2):
+            sock = self._connect()
+            if sock is None:
+                self.start()
+                sock = self._connect()
+                if sock is None:
+                    raise RuntimeError("Fork server is not accepting connections")
+            out_r, out_w = os.pipe()
+            err_r, err_w = os.pipe()
+            try:
+                stdin = sys.stdin.fileno()
+            except (AttributeError, ValueError, io.UnsupportedOperation):
+                stdin = os.open(os.devnull, os.O_RDONLY)
+            try:
+                socket.send_fds(sock, [json.dumps(request).encode()], [stdin, out_w, err_w])
+                header = sock.recv(8, socket.MSG_WAITALL)
+            except (ConnectionResetError, BrokenPipeError):
+                header = b""  # server went away mid-request; treat like stale
+            finally:
+                os.close(out_w)
+                os.close(err_w)
+            pid = struct.unpack("!q", header)[0] if len(header) == 8 else self.STALE
+            if pid != self.STALE:
+                return sock, pid, out_r, err_r
+            # sources changed under the server (it has exited); restart and retry once
+            sock.close()
+            os.close(out_r)
+            os.close(err_r)
+        raise RuntimeError("Fork server kept reporting stale sources")
+
+    def run(self, module_path: str, args: List[str], timeout: Optional[float] = None,
+            env: Optional[Dict[str, str]] = None) -> subprocess.CompletedProcess:
+        """Run ``module_path`` as ``__main__`` in a forked child; blocking"""
+        request = {
+            "path": module_path,
+            "args": list(args),
+            "cwd": os.getcwd(),
+            "env": dict(os.environ if env is None else env),
+        }
+        sock, pid, out_r, err_r = self._submit(request)
+        chunks: Dict[Any, List[bytes]] = {out_r: [], err_r: [], sock: []}
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            with selectors.DefaultSelector() as selector:
+                for source in chunks:
+                    selector.register(source, selectors.EVENT_READ)
+                while selector.get_map():
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        try:
+                            os.kill(pid, signal.SIGKILL)
+                        except ProcessLookupError:
+                            pass
+                        raise TimeoutError(f"Command timed out after {timeout} seconds")
+                    for key, _ in selector.select(remaining):
+                        if key.fileobj is sock:
+                            data = sock.recv(self.BUFFER_SIZE)
+                        else:
+                            data = os.read(key.fd, self.BUFFER_SIZE)
+                        if data:
+                            chunks[key.fileobj].append(data)
+                        else:
+                            selector.unregister(key.fileobj)
+        finally:
+            sock.close()
+            os.close(out_r)
+            os.close(err_r)
+        status = b"".join(chunks[sock])
+        # no status means the child died without reporting (e.g. killed by a signal)
+        returncode = struct.unpack("!q", status)[0] if len(status) == 8 else -1
+        return subprocess.CompletedProcess(
+            [self.python, module_path, *args], returncode,
+            b"".join(chunks[out_r]).decode(errors="replace"),
+            b"".join(chunks[err_r]).decode(errors="replace"),
+        )
+
+def snapshot_tree(dirs: List[Path], suffix: str = ".py") -> Dict[Path, Tuple[int, int]]:
+    """``{path: (mtime_ns, size)}`` of every matching file under ``dirs``"""
+    files: Dict[Path, Tuple[int, int]] = {}
+    stack = [d for d in dirs if d.is_dir()]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith(".") and entry.name != "__pycache__":
+                        stack.append(Path(entry.path))
+                elif entry.name.endswith(suffix):
+                    st = entry.stat()
+                    files[Path(entry.path)] = (st.st_mtime_ns, st.st_size)
+    return files
+
+class ImportGraph:
+    """Module import graph of a source tree, built from the AST and updated per file
+
+    Imports resolve against the importing file's directory (script-style
+    sibling imports), the project root and the src directory, so both
+    ``from src import ski`` and ``from render import ...`` map to files.
+    Imports that resolve outside the tree (stdlib, third party) are dropped.
+    """
+    def __init__(self, root: Path, search: List[Path]):
+        self.root = root.resolve()
+        self.search = [path.resolve() for path in search]
+        self.imports: Dict[Path, Set[Path]] = {}
+
+    def _candidates(self, base: Path, dotted: str) -> Optional[Path]:
+        target = base.joinpath(*dotted.split(".")) if dotted else base
+        for candidate in (target.with_suffix(".py"), target / "__init__.py"):
+            if candidate.is_file():
+                return candidate
+        return None
+
+    def _resolve(self, path: Path, module: str, names: List[str], level: int) -> Set[Path]:
+        if level:
+            bases = [path.parents[level - 1]]
+        else:
+            bases = [path.parent, self.root, *self.search]
+        found: Set[Path] = set()
+        for base in bases:
+            parent = self._candidates(base, module)
+            if parent is None and module:
+                continue
+            # ``from pkg import mod`` imports submodules; ``from mod import name`` only mod
+            for name in names:
+                sub = self._candidates(base, f"{module}.{name}" if module else name)
+                if sub is not None:
+                    found.add(sub)
+            if parent is not None:
+                found.add(parent)
+            if found:
+                break
+        return found
+
+    def parse(self, path: Path) -> None:
+        import ast
+        try:
+            tree = ast.parse(path.read_bytes(), str(path))
+        except (OSError, SyntaxError, ValueError):
+            self.imports[path] = set()
+            return
+        deps: Set[Path] = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    deps |= self._resolve(path, alias.name, [], 0)
+            elif isinstance(node, ast.ImportFrom):
+                deps |= self._resolve(path, node.module or "", [a.name for a in node.names], node.level)
+        deps.discard(path)
+        self.imports[path] = deps
+
+    def update(self, files: Iterable[Path]) -> None:
+        for path in files:
+            path = path.resolve()
+            if path.exists():
+                self.parse(path)
+            else:
+                self.imports.pop(path, None)
+
+    def dependents(self, changed: Iterable[Path]) -> Set[Path]:
+        """Every file that imports one of ``changed``, directly or transitively (plus ``changed``)"""
+        reverse: Dict[Path, Set[Path]] = {}
+        for path, deps in self.imports.items():
+            for dep in deps:
+                reverse.setdefault(dep, set()).add(path)
+        seen = {path.resolve() for path in changed}
+        stack = list(seen)
+        while stack:
+            for importer in reverse.get(stack.pop(), ()):
+                if importer not in seen:
+                    seen.add(importer)
+                    stack.append(importer)
+        return seen
+
+    def dependencies(self, path: Path) -> Set[Path]:
+        """``path`` and every file it imports, directly or transitively (parsed on demand)"""
+        seen = {path.resolve()}
+        stack = list(seen)
+        while stack:
+            current = stack.pop()
+            if current not in self.imports:
+                self.parse(current)
+            for dep in self.imports[current]:
+                if dep not in seen:
+                    seen.add(dep)
+                    stack.append(dep)
+        return seen
+
+def merkle_root(leaves: List[str]) -> str:
+    """Root hash of the repo's ``MerkleTree`` over ``leaves`` (an empty list hashes ``""``)"""
+    from src._representation import MerkleTree, hash_data
+    return MerkleTree(leaves).root_hash if leaves else hash_data("")
+
+class ContentCache:
+    """Content hashes of the inputs behind each tool's last clean result
+
+    Stored as JSON in ``.demiurge/results.json``. File digests are sha256 of
+    the contents, reused while a file's mtime and size are unchanged. Every
+    directory gets a Merkle root over its files' digests and its
+    subdirectories' roots, so a tree whose root matches the last clean run is
+    skipped without looking further, and otherwise only the subtrees whose
+    roots moved are searched for changed files. A clean entry only counts
+    when its ``key`` (tool version and config hash) matches.
+    """
+    VERSION = 1
+
+    def __init__(self, root: Path):
+        self.root = root.resolve()
+        self.path = self.root / ".demiurge" / "results.json"
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") != self.VERSION:
+                data = {}
+        except (OSError, ValueError):
+            data = {}
+        self.stats: Dict[str, List[Any]] = data.get("stats", {})
+        self.results: Dict[str, Dict[str, Any]] = data.get("results", {})
+
+    def relative(self, path: Path) -> str:
+        return path.resolve().relative_to(self.root).as_posix()
+
+    def digest(self, path: Path) -> str:
+        """sha256 of ``path``'s contents, from the stat cache when mtime and size match"""
+        rel = self.relative(path)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self.stats.pop(rel, None)
+            return "<missing>"
+        cached = self.stats.get(rel)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self.stats[rel] = [st.st_mtime_ns, st.st_size, digest]
+        return digest
+
+    def digests(self, files: Iterable[Path]) -> Dict[str, str]:
+        """``{relative posix path: digest}``, dropping stat entries of files that are gone"""
+        digests = {self.relative(path): self.digest(path) for path in files}
+        for rel in [rel for rel in self.stats if not (self.root / rel).exists()]:
+            del self.stats[rel]
+        return digests
+
+    @staticmethod
+    def _layout(digests: Dict[str, str]) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """Files directly in, and child directories of, every directory (``"."`` is the root)"""
+        files: Dict[str, List[str]] = {}
+        children: Dict[str, List[str]] = {}
+        for rel in digests:
+            parent = os.path.dirname(rel) or "."
+            files.setdefault(parent, []).append(rel)
+            while parent != ".":
+                grandparent = os.path.dirname(parent) or "."
+                siblings = children.setdefault(grandparent, [])
+                if parent in siblings:
+                    break
+                siblings.append(parent)
+                parent = grandparent
+        return files, children
+
+    def directory_roots(self, digests: Dict[str, str]) -> Dict[str, str]:
+        """Merkle root of every directory holding (directly or below) one of ``digests``"""
+        if not digests:
+            return {}
+        files, children = self._layout(digests)
+        roots: Dict[str, str] = {}
+        # deepest first, so every subdirectory's root exists before its parent's
+        for directory in sorted(files.keys() | children.keys(), key=lambda d: -d.count("/") - (d != ".")):
+            leaves = [f"{os.path.basename(rel)}\0{digests[rel]}" for rel in files.get(directory, ())]
+            leaves += [f"{os.path.basename(sub)}/\0{roots[sub]}" for sub in children.get(directory, ())]
+            roots[directory] = merkle_root(sorted(leaves))
+        return roots
+
+    def clean(self, tool: str, key: str) -> Dict[str, Any]:
+        """The last clean result of ``tool`` if it was recorded under ``key``, else ``{}``"""
+        entry = self.results.get(tool, {})
+        return entry if entry.get("key") == key else {}
+
+    def changed(self, digests: Dict[str, str], roots: Dict[str, str], clean: Dict[str, Any]) -> List[str]:
+        """Files whose digest differs from ``clean``, searching only directories whose root moved"""
+        old_roots, old_files = clean.get("dirs", {}), clean.get("files", {})
+        files, children = self._layout(digests)
+        changed = []
+        stack = ["."] if digests else []
+        while stack:
+            directory = stack.pop()
+            if old_roots.get(directory) == roots[directory]:
+                continue
+            changed.extend(rel for rel in files.get(directory, ()) if old_files.get(rel) != digests[rel])
+            stack.extend(children.get(directory, ()))
+        return sorted(changed)
+
+    def record(self, tool: str, key: str, **entry: Any) -> None:
+        self.results[tool] = {"key": key, **entry}
+
+    def save(self) -> None:
+        try:
+            self.path.parent.mkdir(exist_ok=True)
+            temp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            temp.write_text(json.dumps({"version": self.VERSION, "stats": self.stats,
+                                        "results": self.results}))
+            os.replace(temp, self.path)
+        except OSError:  # read-only tree: just don't cache
+            pass
+
 class ProjectManager:
     def __init__(self, root_dir: Union[str, Path]):
         self.root_dir = Path(root_dir)
         self.logger = self._setup_logging()
-        self.config = self._load_or_create_config()
-        self.project_config = self._load_project_config()  # Load custom config
+        self.config, self.project_config = self._load_configuration()
         self.ffi_modules = self.project_config["ffi_modules"]  # Access FFI modules
+        self._fork_server: Optional[ForkServer] = None
         self._ensure_directory_structure()
 
     def _setup_logging(self) -> logging.Logger:
@@ -99,6 +777,107 @@ class ProjectManager:
         logger.setLevel(logging.INFO)
         return logger
 
+    CONFIG_SOURCES = ("pyproject.toml", "demiurge.json")
+    SNAPSHOT_VERSION = 1
+
+    @property
+    def _snapshot_path(self) -> Path:
+        return self.root_dir / ".demiurge" / "config.snapshot"
+
+    def _config_stats(self) -> List[Tuple[str, int, int]]:
+        stats = []
+        for name in self.CONFIG_SOURCES:
+            try:
+                st = (self.root_dir / name).stat()
+            except FileNotFoundError:
+                stats.append((name, -1, -1))
+            else:
+                stats.append((name, st.st_mtime_ns, st.st_size))
+        return stats
+
+    def _config_digests(self) -> List[str]:
+        return [self._fingerprint(self.root_dir / name) for name in self.CONFIG_SOURCES]
+
+    def _load_configuration(self) -> Tuple[ProjectConfig, Dict[str, Any]]:
+        """Return the merged config, from the binary snapshot when its sources are unchanged
+
+        The snapshot (``marshal`` of plain data, under ``.demiurge/``) is keyed
+        by each source's mtime and size; if those moved but the contents hash
+        the same, the snapshot is reused and only its key refreshed. Otherwise
+        pyproject.toml and demiurge.json are parsed, defaults written where
+        missing, the result validated and a new snapshot stored.
+        """
+        import marshal
+        snapshot = None
+        try:
+            snapshot = marshal.loads(self._snapshot_path.read_bytes())
+            if snapshot.get("version") != self.SNAPSHOT_VERSION:
+                snapshot = None
+        except (OSError, EOFError, ValueError, TypeError, AttributeError):
+            snapshot = None
+        stats = self._config_stats()
+        if snapshot is not None:
+            cached = [tuple(entry) for entry in snapshot["stats"]]
+            if cached == stats:
+                return self._config_from_snapshot(snapshot)
+            if snapshot["digests"] == self._config_digests():
+                snapshot["stats"] = stats
+                self._write_snapshot(snapshot)
+                return self._config_from_snapshot(snapshot)
+
+        config = self._load_or_create_config()
+        project_config = self._load_project_config()
+        self._validate_config(config, project_config)
+        self._write_snapshot({
+            "version": self.SNAPSHOT_VERSION,
+            "stats": self._config_stats(),  # after any defaults were written
+            "digests": self._config_digests(),
+            "config": {
+                **{name: getattr(config, name) for name in ProjectConfig.__dataclass_fields__},
+                "src_path": str(config.src_path),
+                "tests_path": str(config.tests_path),
+            },
+            "project_config": project_config,
+        })
+        return config, project_config
+
+    @staticmethod
+    def _config_from_snapshot(snapshot: Dict[str, Any]) -> Tuple[ProjectConfig, Dict[str, Any]]:
+        data = dict(snapshot["config"])
+        data["src_path"] = Path(data["src_path"])
+        data["tests_path"] = Path(data["tests_path"])
+        return ProjectConfig(**data), snapshot["project_config"]
+
+    def _write_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        import marshal
+        try:
+            self._snapshot_path.parent.mkdir(exist_ok=True)
+            temp = self._snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+            temp.write_bytes(marshal.dumps(snapshot))
+            os.replace(temp, self._snapshot_path)
+        except (OSError, ValueError) as e:  # read-only tree or unmarshallable value: just don't cache
+            self.logger.debug(f"Config snapshot not written: {e}")
+
+    @staticmethod
+    def _validate_config(config: ProjectConfig, project_config: Dict[str, Any]) -> None:
+        """Raise ``ValueError`` describing every malformed field"""
+        problems = []
+        for name in ("name", "version", "python_version"):
+            if not isinstance(getattr(config, name), str):
+                problems.append(f"project.{name} must be a string")
+        for name in ("dependencies", "dev_dependencies", "ffi_modules"):
+            value = getattr(config, name)
+            if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+                problems.append(f"project.{name} must be a list of strings")
+        if not isinstance(config.ruff_config, dict):
+            problems.append("tool.ruff must be a table")
+        if not isinstance(project_config, dict):
+            problems.append("demiurge.json must contain an object")
+        elif not isinstance(project_config.get("ffi_modules"), list):
+            problems.append("demiurge.json ffi_modules must be a list")
+        if problems:
+            raise ValueError("Invalid project configuration: " + "; ".join(problems))
+
     def _load_project_config(self) -> Dict[str, Any]:
         """Load project-specific configuration from demiurge.json"""
         config_path = self.root_dir / "demiurge.json"
@@ -181,8 +960,7 @@ class ProjectManager:
         }
         
         with open(self.root_dir / "pyproject.toml", "w", encoding='utf-8') as f:
-            toml_str = tomllib.dumps(data)
-            f.write(toml_str)
+            f.write(dump_toml(data))
 
     def _ensure_directory_structure(self):
         """Create necessary project directories if they don't exist"""
@@ -209,8 +987,13 @@ class ProjectManager:
         finally:
             os.unlink(temp_path)
 
-    async def run_uv_command(self, cmd: List[str], timeout: Optional[float] = None) -> subprocess.CompletedProcess:
-        """Run a UV command asynchronously with timeout support"""
+    async def run_uv_command(self, cmd: List[str], timeout: Optional[float] = None,
+                             check: bool = True) -> subprocess.CompletedProcess:
+        """Run a UV command asynchronously with timeout support
+
+        With ``check`` (the default) a nonzero exit raises ``RuntimeError``;
+        otherwise the ``CompletedProcess`` is returned either way.
+        """
         self.logger.debug(f"Running UV command: {' '.join(cmd)}")
         
         try:
@@ -233,7 +1016,7 @@ class ProjectManager:
                     pass
                 raise TimeoutError(f"Command timed out after {timeout} seconds")
             
-            if process.returncode != 0:
+            if check and process.returncode != 0:
                 error_msg = stderr.decode()
                 self.logger.error(f"UV command failed: {error_msg}")
                 raise RuntimeError(f"UV command failed: {error_msg}")
@@ -246,115 +1029,423 @@ class ProjectManager:
             self.logger.error(f"Command not found: {cmd[0]}")
             raise RuntimeError(f"Command not found: {cmd[0]}. Is UV installed?")
 
-    async def setup_environment(self):
-            """Set up the virtual environment and install dependencies"""
+    @property
+    def _setup_state_path(self) -> Path:
+        # kept inside the venv so deleting the venv also forgets what was installed into it
+        return self.root_dir / ".venv" / "demiurge-setup.json"
+
+    def _load_setup_state(self) -> Dict[str, str]:
+        try:
+            return json.loads(self._setup_state_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_setup_state(self, state: Dict[str, str]) -> None:
+        if self._setup_state_path.parent.exists():
+            self._setup_state_path.write_text(json.dumps(state, indent=2, sort_keys=True))
+
+    @staticmethod
+    def _fingerprint(*inputs: Union[Path, str]) -> str:
+        """Hash file contents (``Path``, missing files included) and literal strings"""
+        digest = hashlib.sha256()
+        for item in inputs:
+            if isinstance(item, Path):
+                digest.update(str(item).encode())
+                digest.update(item.read_bytes() if item.exists() else b"<missing>")
+            else:
+                digest.update(item.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    async def _setup_step(self, name: str, description: str, fingerprint: str, state: Dict[str, str],
+                          action: Callable[[], Coroutine[Any, Any, Any]], force: bool = False) -> bool:
+        """Run ``action`` unless ``state`` shows it succeeded with the same inputs; returns whether it ran"""
+        if not force and state.get(name) == fingerprint:
+            self.logger.info(f"Skipping {name}: inputs unchanged")
+            return False
+        self.logger.info(description)
+        await action()
+        state[name] = fingerprint
+        self._save_setup_state(state)
+        return True
+
+    @staticmethod
+    def _write_if_changed(path: Path, content: str) -> None:
+        """Write only when different, so unchanged inputs keep their fingerprint and mtime"""
+        if not path.exists() or path.read_text() != content:
+            path.write_text(content)
+
+    async def setup_environment(self, force: bool = False) -> Dict[str, Optional[float]]:
+            """Set up the virtual environment and install dependencies
+
+            Setup is a small DAG of stages run concurrently where dependencies
+            allow: the venv and both lock-file compiles are independent, each
+            install waits for the venv and its lock file, and installs into
+            the venv are serialized. Each stage is fingerprinted by its inputs
+            (interpreter version, requirements and lock files, setup.py and
+            pyproject.toml) and skipped when the fingerprint matches the last
+            successful run recorded in the venv; ``force`` reruns everything.
+            Returns per-stage wall time in seconds (``None`` when skipped).
+            """
             self.logger.info("Setting up UV environment...")
-            
-            # Create virtual environment
-            await self.run_uv_command(["uv", "venv"])
+            state = {} if force else self._load_setup_state()
+            root = self.root_dir
+            interpreter = f"{platform.python_implementation()} {platform.python_version()} {sys.executable}"
+            venv_marker = root / ".venv" / "pyvenv.cfg"
+            if not venv_marker.exists():
+                state = {}
             
             # Create requirements files
-            requirements_path = self.root_dir / "requirements.txt"
-            dev_requirements_path = self.root_dir / "requirements-dev.txt"
+            requirements_path = root / "requirements.txt"
+            dev_requirements_path = root / "requirements-dev.txt"
+            lock_path = root / "requirements.lock"
+            dev_lock_path = root / "requirements-dev.lock"
             
             # Write main requirements
             if self.config.dependencies:
-                with open(requirements_path, 'w') as f:
-                    f.write('\n'.join(self.config.dependencies) + '\n')
+                self._write_if_changed(requirements_path, '\n'.join(self.config.dependencies) + '\n')
             
             # Write dev requirements
             if self.config.dev_dependencies:
-                with open(dev_requirements_path, 'w') as f:
-                    f.write('\n'.join(self.config.dev_dependencies) + '\n')
-            
-            # Generate lock file for main requirements
-            if requirements_path.exists():
-                self.logger.info("Compiling requirements...")
-                await self.run_uv_command([
-                    "uv", "pip", "compile", 
-                    str(requirements_path), 
-                    "--output-file", 
-                    str(self.root_dir / "requirements.lock")
-                ])
-            
-            # Generate lock file for dev requirements
-            if dev_requirements_path.exists():
-                self.logger.info("Compiling dev requirements...")
-                await self.run_uv_command([
-                    "uv", "pip", "compile", 
-                    str(dev_requirements_path), 
-                    "--output-file", 
-                    str(self.root_dir / "requirements-dev.lock")
-                ])
+                self._write_if_changed(dev_requirements_path, '\n'.join(self.config.dev_dependencies) + '\n')
+
+            def venv_fingerprint() -> str:
+                return self._fingerprint(interpreter, venv_marker)
+
+            stages = [SetupStage("venv", lambda: self._setup_step(
+                "venv", "Creating virtual environment...", self._fingerprint(interpreter), state,
+                lambda: self.run_uv_command(["uv", "venv"]), force,
+            ))]
             
-            # Install from lock files
-            if (self.root_dir / "requirements.lock").exists():
-                self.logger.info("Installing dependencies from lock file...")
-                await self.run_uv_command([
-                    "uv", "pip", "install", 
-                    "-r", str(self.root_dir / "requirements.lock")
-                ])
+            # Generate lock files; a deleted lock file also invalidates the step
+            for label, source, lock in (("requirements", requirements_path, lock_path),
+                                        ("dev requirements", dev_requirements_path, dev_lock_path)):
+                if source.exists():
+                    stages.append(SetupStage(f"compile:{source.name}", partial(
+                        self._setup_step,
+                        f"compile:{source.name}", f"Compiling {label}...",
+                        self._fingerprint(interpreter, source), state,
+                        partial(self.run_uv_command,
+                                ["uv", "pip", "compile", str(source), "--output-file", str(lock)]),
+                        force or not lock.exists(),
+                    )))
             
-            if (self.root_dir / "requirements-dev.lock").exists():
-                self.logger.info("Installing dev dependencies from lock file...")
-                await self.run_uv_command([
-                    "uv", "pip", "install", 
-                    "-r", str(self.root_dir / "requirements-dev.lock")
-                ])
+            # Install from lock files, one at a time into the shared venv
+            async def install(label: str, lock: Path) -> bool:
+                if not lock.exists():
+                    return False
+                return await self._setup_step(
+                    f"install:{lock.name}", f"Installing {label} from lock file...",
+                    self._fingerprint(venv_fingerprint(), lock), state,
+                    partial(self.run_uv_command, ["uv", "pip", "install", "-r", str(lock)]),
+                    force,
+                )
+
+            stages.append(SetupStage(
+                f"install:{lock_path.name}", partial(install, "dependencies", lock_path),
+                ("venv", f"compile:{requirements_path.name}"),
+            ))
+            stages.append(SetupStage(
+                f"install:{dev_lock_path.name}", partial(install, "dev dependencies", dev_lock_path),
+                ("venv", f"compile:{dev_requirements_path.name}", f"install:{lock_path.name}"),
+            ))
             
             # Install the project in editable mode if setup.py exists
-            if (self.root_dir / "setup.py").exists():
-                self.logger.info("Installing project in editable mode...")
-                await self.run_uv_command(["uv", "pip", "install", "-e", "."])
+            if (root / "setup.py").exists():
+                stages.append(SetupStage("editable", lambda: self._setup_step(
+                    "editable", "Installing project in editable mode...",
+                    self._fingerprint(venv_fingerprint(), root / "setup.py", root / "pyproject.toml"),
+                    state, partial(self.run_uv_command, ["uv", "pip", "install", "-e", "."]), force,
+                ), (f"install:{lock_path.name}", f"install:{dev_lock_path.name}")))
+
+            timings = await run_stages(stages)
+            for name, seconds in timings.items():
+                self.logger.info(f"  {name:<32} {'skipped' if seconds is None else f'{seconds:.2f}s'}")
+            return timings
 
-    async def run_app(self, module_path: str, *args, timeout: Optional[float] = None):
-        """Run the application using Python directly"""
+    # Imported by the fork server up front. Only modules without import-time
+    # side effects belong here; project modules are opted into through
+    # demiurge.json "preload" under their package name (``src.ski``).
+    FORK_SERVER_PRELOAD = (
+        "asyncio", "collections", "concurrent.futures", "dataclasses", "hashlib",
+        "itertools", "json", "logging", "math", "multiprocessing", "pickle",
+        "random", "struct", "subprocess", "threading", "typing",
+        "numpy",  # optional; skipped when not installed
+    )
+
+    def _preload_modules(self) -> List[str]:
+        """Modules the fork server imports up front: the defaults plus any demiurge.json "preload" list"""
+        extra = self.project_config.get("preload", [])
+        return list(dict.fromkeys([*self.FORK_SERVER_PRELOAD, *extra]))
+
+    async def run_app(self, module_path: str, *args, timeout: Optional[float] = None,
+                      warm: bool = False, check: bool = True):
+        """Run the application using Python directly
+
+        With ``warm`` the script runs in a child forked from a pre-warmed
+        ``ForkServer`` instead of a fresh interpreter.
+        """
         module_path = str(Path(module_path))
         cmd = ["python", module_path, *map(str, args)]
-        self.logger.info(f"Running: {' '.join(cmd)}")
-        return await self.run_uv_command(cmd, timeout=timeout)
+        if not (warm and ForkServer.supported()):
+            self.logger.info(f"Running: {' '.join(cmd)}")
+            return await self.run_uv_command(cmd, timeout=timeout, check=check)
+        self.logger.info(f"Running (warm): {' '.join(cmd)}")
+        if self._fork_server is None:
+            self._fork_server = ForkServer(self.root_dir, self._preload_modules())
+        result = await asyncio.to_thread(
+            self._fork_server.run, module_path, list(map(str, args)), timeout
+        )
+        if check and result.returncode != 0:
+            self.logger.error(f"Command failed: {result.stderr}")
+            raise RuntimeError(f"Command failed: {result.stderr}")
+        return result
 
-    async def run_tests(self):
-        """Run tests using pytest"""
-        await self.run_uv_command(["uvx", "run", "-m", "pytest", str(self.config.tests_path)])
+    async def run_many(self, jobs: List[Job], concurrency: Optional[int] = None,
+                       timeout: Optional[float] = None, retries: int = 0, warm: bool = False,
+                       output: Optional[io.TextIOBase] = None) -> int:
+        """Run jobs concurrently on a bounded pool, writing one JSON line per finished job
 
-    async def run_linter(self):
+        Concurrency defaults to the CPU count. A job is retried (with
+        exponential backoff) on a nonzero exit or timeout; per-job ``timeout``
+        and ``retries`` override the defaults. Returns the number of failed jobs.
+        """
+        output = output or sys.stdout
+        limit = asyncio.Semaphore(concurrency or os.cpu_count() or 1)
+
+        async def run_job(job: Job) -> bool:
+            attempts = 1 + (retries if job.retries is None else job.retries)
+            job_timeout = timeout if job.timeout is None else job.timeout
+            record: Dict[str, Any] = {"id": job.id, "module_path": job.module_path, "args": job.args}
+            async with limit:
+                started = time.monotonic()
+                for attempt in range(1, attempts + 1):
+                    record.update(attempt=attempt, returncode=None, error=None,
+                                  stdout=None, stderr=None)
+                    try:
+                        result = await self.run_app(job.module_path, *job.args, timeout=job_timeout,
+                                                    warm=warm, check=False)
+                        record.update(returncode=result.returncode, stdout=result.stdout,
+                                      stderr=result.stderr)
+                        if result.returncode == 0:
+                            break
+                    except (TimeoutError, RuntimeError) as e:
+                        record["error"] = str(e)
+                    if attempt < attempts:
+                        await asyncio.sleep(0.1 * 2 ** (attempt - 1))
+                record["duration"] = round(time.monotonic() - started, 6)
+            record["ok"] = record["returncode"] == 0
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+            return record["ok"]
+
+        results = await asyncio.gather(*(run_job(job) for job in jobs))
+        return results.count(False)
+
+    PYTEST = ["uvx", "run", "-m", "pytest"]
+    RUFF = ["uvx", "run", "-m", "ruff"]
+
+    async def _tool_key(self, tool: List[str], *inputs: Union[Path, str]) -> str:
+        """Fingerprint of the tool's reported version and its config ``inputs``"""
+        version = await self.run_uv_command([*tool, "--version"], check=False)
+        return self._fingerprint(" ".join(tool), version.stdout.strip(), *inputs)
+
+    async def run_tests(self, paths: Optional[List[str]] = None, check: bool = True,
+                        use_cache: bool = True):
+        """Run tests using pytest (the whole tests path unless ``paths`` is given)
+
+        A whole-suite run skips test modules that passed last time with the
+        same inputs: the module itself, everything it imports (transitively,
+        via the ``ImportGraph``), every conftest.py, the pytest config files
+        and the pytest version. If nothing under src/ and tests/ changed at
+        all, pytest is not started. Results are recorded only when the run
+        passes; ``use_cache=False`` runs everything and refreshes the record.
+        """
+        if paths:
+            return await self.run_uv_command([*self.PYTEST, *paths], check=check)
+        root = self.root_dir.resolve()
+        src, tests = root / self.config.src_path, root / self.config.tests_path
+        cache = ContentCache(root)
+        digests = cache.digests(snapshot_tree([src, tests]))
+        conftests = sorted(f"{rel}\0{digest}" for rel, digest in digests.items()
+                           if os.path.basename(rel) == "conftest.py")
+        key = await self._tool_key(self.PYTEST, *(root / name for name in (
+            "pyproject.toml", "pytest.ini", "setup.cfg", "tox.ini", "conftest.py")), *conftests)
+        roots = cache.directory_roots(digests)
+        clean = cache.clean("pytest", key) if use_cache else {}
+        if roots and clean.get("dirs", {}).get(".") == roots["."]:
+            self.logger.info(f"Skipping tests: {len(digests)} file(s) unchanged since the last pass")
+            cache.save()
+            return subprocess.CompletedProcess(self.PYTEST, 0, "", "")
+
+        graph = ImportGraph(root, [src])
+        modules = {}
+        for path in sorted(snapshot_tree([tests])):
+            if self._is_test_file(path):
+                leaves = [f"{cache.relative(dep)}\0{cache.digest(dep)}" for dep in graph.dependencies(path)]
+                modules[cache.relative(path)] = merkle_root(sorted(leaves))
+        passed = clean.get("modules", {})
+        stale = [rel for rel, module_key in modules.items() if passed.get(rel) != module_key]
+        if modules and not stale:
+            self.logger.info(f"Skipping tests: all {len(modules)} module(s) passed with the same inputs")
+            result = subprocess.CompletedProcess(self.PYTEST, 0, "", "")
+        else:
+            if stale and len(stale) < len(modules):
+                self.logger.info(f"Running {len(stale)} of {len(modules)} test module(s); "
+                                 "the rest passed with the same inputs")
+                targets = [os.path.relpath(root / rel) for rel in stale]
+            else:
+                targets = [str(self.config.tests_path)]
+            result = await self.run_uv_command([*self.PYTEST, *targets], check=check)
+        if result.returncode == 0:
+            cache.record("pytest", key, dirs=roots, modules=modules)
+        cache.save()
+        return result
+
+    @staticmethod
+    def _is_test_file(path: Path) -> bool:
+        return path.name.startswith("test_") or path.stem.endswith("_test")
+
+    async def watch(self, interval: float = 0.5, debounce: float = 0.3) -> None:
+        """Rerun only the tests affected by changes under src/ and tests/ until interrupted
+
+        The trees are polled every ``interval`` seconds; once something
+        changes, polling continues until ``debounce`` seconds pass without
+        further changes, so a burst of saves triggers one run. Changed files
+        are mapped to test modules through the ``ImportGraph``. A changed
+        ``conftest.py`` or a deleted file reruns the whole suite.
+        """
+        root = self.root_dir.resolve()
+        src, tests = root / self.config.src_path, root / self.config.tests_path
+        graph = ImportGraph(root, [src])
+        current = snapshot_tree([src, tests])
+        graph.update(current)
+        self.logger.info(f"Watching {src} and {tests} ({len(current)} files); Ctrl-C to stop")
+        while True:
+            await asyncio.sleep(interval)
+            latest = snapshot_tree([src, tests])
+            if latest == current:
+                continue
+            while True:  # debounce: wait for the burst of saves to settle
+                await asyncio.sleep(debounce)
+                settled = snapshot_tree([src, tests])
+                if settled == latest:
+                    break
+                latest = settled
+            changed = {p for p in latest.keys() | current.keys() if latest.get(p) != current.get(p)}
+            current = latest
+            graph.update(changed)
+            if any(p.name == "conftest.py" or p not in latest for p in changed):
+                targets = None
+            else:
+                targets = sorted(os.path.relpath(p) for p in graph.dependents(changed)
+                                 if self._is_test_file(p) and p in latest)
+                if not targets:
+                    self.logger.info(f"{len(changed)} file(s) changed; no tests affected")
+                    continue
+            self.logger.info(f"{len(changed)} file(s) changed; running "
+                             f"{'the full suite' if targets is None else ' '.join(targets)}")
+            result = await self.run_tests(targets, check=False)
+            print(result.stdout, end="")
+            print(result.stderr, end="", file=sys.stderr)
+            self.logger.info("tests passed" if result.returncode == 0 else f"tests failed ({result.returncode})")
+
+    async def _run_ruff(self, subcommand: str, use_cache: bool = True) -> None:
+        """Run ``ruff <subcommand>`` on the files changed since its last clean run
+
+        Cleanliness is keyed by the ruff version, the ruff config files and
+        each file's content hash. With no clean record (or ``use_cache=False``)
+        the whole tree is passed as before; otherwise only the changed files,
+        with ``--force-exclude`` so ruff's own excludes still apply.
+        """
+        root = self.root_dir.resolve()
+        cache = ContentCache(root)
+        digests = cache.digests(snapshot_tree([root]))
+        key = await self._tool_key(self.RUFF, subcommand, root / "pyproject.toml",
+                                   root / "ruff.toml", root / ".ruff.toml")
+        roots = cache.directory_roots(digests)
+        clean = cache.clean(f"ruff-{subcommand}", key) if use_cache else {}
+        files = cache.changed(digests, roots, clean)
+        if digests and not files:
+            self.logger.info(f"Skipping ruff {subcommand}: {len(digests)} file(s) unchanged since the last clean run")
+            cache.save()
+            return
+        if clean and files:
+            self.logger.info(f"ruff {subcommand}: {len(files)} of {len(digests)} file(s) changed")
+            targets = ["--force-exclude", *(os.path.relpath(root / rel) for rel in files)]
+        else:
+            targets = ["."]
+        await self.run_uv_command([*self.RUFF, subcommand, *targets])
+        if subcommand == "format":  # rewritten files are clean with their new contents
+            digests = cache.digests(snapshot_tree([root]))
+            roots = cache.directory_roots(digests)
+        cache.record(f"ruff-{subcommand}", key, dirs=roots, files=digests)
+        cache.save()
+
+    async def run_linter(self, use_cache: bool = True):
         """Run Ruff linter"""
-        await self.run_uv_command(["uvx", "run", "-m", "ruff", "check", "."])
+        await self._run_ruff("check", use_cache)
 
-    async def format_code(self):
+    async def format_code(self, use_cache: bool = True):
         """Format code using Ruff"""
-        await self.run_uv_command(["uvx", "run", "-m", "ruff", "format", "."])
+        await self._run_ruff("format", use_cache)
 
-async def main():
-    """Main entry point for the project manager"""
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse the command line; kept out of ``main`` so ``--help`` never loads asyncio"""
     import argparse
     
     parser = argparse.ArgumentParser(description="UV-based Project Manager")
     parser.add_argument("--root", default=".", help="Project root directory")
     parser.add_argument("command", choices=[
-        "setup", "run", "test", "lint", "format"
+        "setup", "run", "run-many", "test", "watch", "lint", "format"
     ], help="Command to execute")
     parser.add_argument("args", nargs="*", help="Additional arguments")
     parser.add_argument("--timeout", type=float, help="Timeout in seconds for commands")
+    parser.add_argument("--warm", action="store_true",
+                        help="run: fork from a pre-warmed interpreter instead of starting python")
+    parser.add_argument("--force", action="store_true",
+                        help="setup: rerun every step even if its inputs are unchanged")
+    parser.add_argument("-j", "--jobs", type=int,
+                        help="run-many: concurrent jobs (default: CPU count)")
+    parser.add_argument("--retries", type=int, default=0,
+                        help="run-many: retries per failed or timed-out job")
+    parser.add_argument("--no-cache", dest="cache", action="store_false",
+                        help="test/lint/format: ignore results cached for unchanged files")
     
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+async def main(args=None):
+    """Main entry point for the project manager"""
+    if args is None:
+        args = parse_args()
     
     manager = ProjectManager(args.root)
     
     try:
         if args.command == "setup":
-            await manager.setup_environment()
+            await manager.setup_environment(force=args.force)
         elif args.command == "run":
             if not args.args:
                 raise ValueError("Module path required for 'run' command")
-            await manager.run_app(args.args[0], *args.args[1:], timeout=args.timeout)
+            await manager.run_app(args.args[0], *args.args[1:], timeout=args.timeout,
+                                  warm=args.warm)
+        elif args.command == "run-many":
+            if not args.args:
+                raise ValueError("Manifest path (or '-') required for 'run-many' command")
+            failed = await manager.run_many(load_manifest(args.args[0]), args.jobs,
+                                            timeout=args.timeout, retries=args.retries,
+                                            warm=args.warm)
+            if failed:
+                manager.logger.error(f"{failed} job(s) failed")
+                return 1
         elif args.command == "test":
-            await manager.run_tests()
+            await manager.run_tests(use_cache=args.cache)
+        elif args.command == "watch":
+            await manager.watch()
         elif args.command == "lint":
-            await manager.run_linter()
+            await manager.run_linter(use_cache=args.cache)
         elif args.command == "format":
-            await manager.format_code()
+            await manager.format_code(use_cache=args.cache)
     
     except Exception as e:
         manager.logger.error(f"Error: {e}")
@@ -363,4 +1454,8 @@ async def main():
     return 0
 
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
\ No newline at end of file
+    cli_args = parse_args()  # before touching asyncio, so --help stays cheap
+    try:
+        sys.exit(asyncio.run(main(cli_args)))
+    except KeyboardInterrupt:
+        sys.exit(130)
\ No newline at end of file
@@ -12,6 +12,8 @@ Key Concepts:
 - Energy-based sorting (Maxwell's Demon)
 - Morphological transformations
 - Merkle-like data structures
+
+NumPy is optional and only used to accelerate batch sorting (in src.merktree).
 """
 
 import hashlib
@@ -26,6 +28,8 @@ from typing import (
     TypeVar, Union
 )
 
+from src.merktree import MaxwellDemon  # shared batch sorter
+
 # Type Variables for Generic Programming
 T = TypeVar('T')
 S = TypeVar('S')
@@ -82,23 +86,6 @@ class SKICombinator:
         """Identity combinator"""
         return x
 
-# Maxwell's Demon for Energy-Based Sorting
-class MaxwellDemon:
-    """Information sorter based on Maxwell's Demon concept."""
-    def __init__(self, energy_threshold: float = 0.5):
-        self.energy_threshold = energy_threshold
-        self.high_energy = deque()
-        self.low_energy = deque()
-
-    def sort(self, particle: Any, energy: float) -> None:
-        if energy > self.energy_threshold:
-            self.high_energy.append(particle)
-        else:
-            self.low_energy.append(particle)
-
-    def get_sorted(self) -> tuple[deque, deque]:
-        return self.high_energy, self.low_energy
-
 # Quantum Processor for Complex Information Processing
 class QuantumProcessor:
     """Main quantum information processing system."""
@@ -263,9 +250,7 @@ def transducer_pipeline(data: list[T], energy_function: Callable[[T], float], pr
     transformed = processor.apply_ski(measured, lambda x: x * 2 if isinstance(x, (int, float)) else x)
 
     # Sort using Maxwell's Demon
-    for item in data:
-        energy = energy_function(item)
-        processor.demon.sort(item, energy)
+    processor.demon.sort_batch(data, energy_function)
 
     return transformed, processor.demon.get_sorted()
 
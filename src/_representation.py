@@ -2,16 +2,17 @@ import hashlib
 from dataclasses import dataclass, field
 from typing import Optional, List, Union
 
+try:
+    from .render import TreeRenderer, color_from_hash
+except ImportError:  # executed as a script from within src/
+    from render import TreeRenderer, color_from_hash
+
 
 # --- Utility Functions ---
 
 def generate_color_from_hash(hash_str: str) -> str:
     """Generate an ANSI escape color code based on the first 6 characters of a hash."""
-    color_value = int(hash_str[:6], 16)  # Convert the first 6 chars to an integer
-    r = (color_value >> 16) % 256
-    g = (color_value >> 8) % 256
-    b = color_value % 256
-    return f"\033[38;2;{r};{g};{b}m"  # ANSI color escape sequence
+    return color_from_hash(hash_str)  # memoized by hash prefix
 
 
 def hash_data(data: str) -> str:
@@ -96,17 +97,24 @@ class MerkleTree:
         """Return the hash of the root node of the tree."""
         return self.root.hash
 
-    def visualize(self):
-        """Recursively visualizes the tree structure."""
-        def traverse(node: Node, depth: int = 0):
-            print(f"{'  ' * depth}{node}")
-            if isinstance(node, InternalNode):
-                traverse(node.left, depth + 1)
-                if node.right:
-                    traverse(node.right, depth + 1)
+    def visualize(self, **render_options):
+        """Visualizes the tree structure, buffered and written in one call."""
+        renderer = TreeRenderer(**render_options)
 
-        print("Merkle Tree Visualization:")
-        traverse(self.root)
+        def children(node: Node) -> List[Node]:
+            if isinstance(node, InternalNode):
+                return [node.left, node.right] if node.right else [node.left]
+            return []
+
+        def label(node: Node) -> str:
+            tag = renderer.paint(node.hash, width=6)
+            if isinstance(node, LeafNode):
+                return f"Leaf({node.data[:10]})[{tag}]"
+            return f"Internal[{tag}]"
+
+        renderer.line("Merkle Tree Visualization:")
+        renderer.tree(self.root, children, label)
+        renderer.flush()
 
 
 # --- Example Usage and Debugging ---
@@ -0,0 +1,28 @@
+"""
+Deferred Module Imports
+
+Shared by main.py and src/handle.py: a module bound to a ``LazyModule`` is
+only imported when one of its attributes is first used, so each command
+line pays only for the modules it actually touches.
+
+Dependencies: Python 3.13+ Standard Library
+"""
+
+import importlib
+from typing import Any, Dict
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access
+
+    The first access imports the real module and rebinds the global name to
+    it, so later lookups cost nothing. ``importlib.import_module`` holds the
+    import lock, which keeps this safe to trigger from worker threads.
+    """
+    def __init__(self, name: str, namespace: Dict[str, Any]):
+        self._name = name
+        self._namespace = namespace
+
+    def __getattr__(self, attr: str) -> Any:
+        module = importlib.import_module(self._name)
+        self._namespace[self._name] = module
+        return getattr(module, attr)
@@ -11,7 +11,7 @@ Key Concepts:
 - Morphological State Reflection
 - Merkle Ring Data Structures
 
-Dependencies: Python 3.13+ Standard Library
+Dependencies: Python 3.13+ Standard Library (NumPy optional, used for batch sorting)
 """
 
 import hashlib
@@ -20,12 +20,28 @@ import math
 import random
 from typing import (
     Any, Callable, TypeVar, Generic, List, Optional, Protocol,
-    Union, Tuple, Deque
+    Union, Tuple, Deque, Sequence, Iterable, Iterator, Dict
 )
 from dataclasses import dataclass, field
-from collections import deque
+from collections import deque, OrderedDict
 from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
 import itertools
+import pickle
+import threading
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:  # optional; pure-Python fallbacks are used instead
+    np = None
+
+try:
+    from .render import TreeRenderer, color_from_hash
+    from . import ski as ski_graph
+except ImportError:  # executed as a script from within src/
+    from render import TreeRenderer, color_from_hash
+    import ski as ski_graph
 
 # Generic Type Variables
 T = TypeVar('T')
@@ -43,27 +59,155 @@ def hash_data(data: Union[str, bytes]) -> str:
     return hashlib.sha256(data).hexdigest()
 
 def generate_color_from_hash(hash_str: str) -> str:
-    """Generate an ANSI color code based on the hash string."""
-    color_value = int(hash_str[:6], 16)
-    r = (color_value >> 16) % 256
-    g = (color_value >> 8) % 256
-    b = color_value % 256
-    return f"\033[38;2;{r};{g};{b}m"
+    """Generate an ANSI color code based on the hash string (memoized by prefix)."""
+    return color_from_hash(hash_str)
+
+class UniformAmplitudes(Sequence[float]):
+    """Implicit amplitude vector of a uniform superposition (O(1) memory)."""
+    __slots__ = ("n", "value")
+
+    def __init__(self, n: int):
+        self.n = n
+        self.value = 1 / math.sqrt(n) if n else 0.0
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.value] * len(range(*index.indices(self.n)))
+        if not -self.n <= index < self.n:
+            raise IndexError("amplitude index out of range")
+        return self.value
+
+    def __repr__(self) -> str:
+        return f"UniformAmplitudes(n={self.n}, value={self.value:.6g})"
+
+def build_alias_table(weights: Sequence[float]) -> Tuple[List[float], List[int]]:
+    """Vose's alias method: O(n) setup for O(1) weighted sampling."""
+    n = len(weights)
+    total = math.fsum(weights)
+    if n == 0 or total <= 0:
+        raise ValueError("weights must be non-empty with a positive sum")
+    scaled = [w * n / total for w in weights]
+    prob = [0.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s_i, l_i = small.pop(), large.pop()
+        prob[s_i] = scaled[s_i]
+        alias[s_i] = l_i
+        scaled[l_i] = (scaled[l_i] + scaled[s_i]) - 1.0
+        (small if scaled[l_i] < 1.0 else large).append(l_i)
+    for i in itertools.chain(small, large):  # leftovers are 1 up to rounding
+        prob[i] = 1.0
+    return prob, alias
+
+def reservoir_sample(iterable: Iterable[T], k: int = 1) -> List[T]:
+    """Uniform sample of ``k`` items from a stream of unknown length (Algorithm L)."""
+    if k < 0:
+        raise ValueError("sample size must be non-negative")
+    if k == 0:
+        return []
+    iterator = iter(iterable)
+    reservoir = list(itertools.islice(iterator, k))
+    if len(reservoir) < k:
+        return reservoir
+    # 1.0 - random() lies in (0, 1], so its log is finite; w is kept below 1
+    # so that log1p(-w) never hits log(0) when w rounds up
+    w_max = math.nextafter(1.0, 0.0)
+    w = min(math.exp(math.log(1.0 - random.random()) / k), w_max)
+    while True:
+        skip = int(math.log(1.0 - random.random()) / math.log1p(-w))
+        try:
+            item = next(itertools.islice(iterator, skip, None))
+        except StopIteration:
+            return reservoir
+        reservoir[random.randrange(k)] = item
+        w = min(w * math.exp(math.log(1.0 - random.random()) / k), w_max)
 
-@dataclass
 class QuantumState(Generic[T]):
-    """Represents a quantum superposition of states."""
-    possibilities: List[T]
-    amplitudes: List[float]
+    """
+    Represents a quantum superposition of states.
 
-    def __init__(self, possibilities: List[T]):
-        n = len(possibilities)
+    Uniform superpositions (no ``amplitudes`` given) are implicit: nothing of
+    size n is allocated, so ``possibilities`` may itself be a lazy sequence
+    such as ``range(10**12)``. Non-uniform states precompute a Vose alias
+    table once, making every measurement O(1). Outcome probabilities follow
+    the Born rule, ``|amplitude| ** 2`` normalized.
+    """
+    __slots__ = ("possibilities", "_amplitudes", "_alias")
+
+    def __init__(self, possibilities: Sequence[T], amplitudes: Optional[Sequence[float]] = None):
         self.possibilities = possibilities
-        self.amplitudes = [1 / math.sqrt(n)] * n
+        if amplitudes is None:
+            self._amplitudes = None
+            self._alias = None
+        else:
+            if len(amplitudes) != len(possibilities):
+                raise ValueError("possibilities and amplitudes must have the same length")
+            self._amplitudes = list(amplitudes)
+            self._alias = build_alias_table([abs(a) ** 2 for a in self._amplitudes])
+
+    @property
+    def amplitudes(self) -> Sequence[float]:
+        if self._amplitudes is None:
+            return UniformAmplitudes(len(self.possibilities))
+        return self._amplitudes
+
+    @property
+    def is_uniform(self) -> bool:
+        return self._amplitudes is None
+
+    def __repr__(self) -> str:
+        return f"QuantumState(possibilities={self.possibilities!r}, amplitudes={self.amplitudes!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, QuantumState):
+            return NotImplemented
+        if len(self.possibilities) != len(other.possibilities):
+            return False
+        if self.possibilities != other.possibilities:
+            return False
+        if self.is_uniform and other.is_uniform:
+            return True  # never materialize an implicit amplitude vector
+        if self.is_uniform or other.is_uniform:
+            uniform, explicit = (self, other) if self.is_uniform else (other, self)
+            value = uniform.amplitudes.value
+            return all(a == value for a in explicit._amplitudes)
+        return self._amplitudes == other._amplitudes
+
+    def _index(self) -> int:
+        n = len(self.possibilities)
+        if n == 0:
+            raise IndexError("cannot collapse an empty superposition")
+        i = random.randrange(n)
+        if self._alias is None:
+            return i
+        prob, alias = self._alias
+        return i if random.random() < prob[i] else alias[i]
 
     def collapse(self) -> T:
-        """Collapses the wave function to a single state."""
-        return random.choices(self.possibilities, weights=self.amplitudes)[0]
+        """Collapses the wave function to a single state in O(1); ``IndexError`` if empty."""
+        return self.possibilities[self._index()]
+
+    def collapse_many(self, k: int) -> List[T]:
+        """Draw ``k`` independent measurements in one call; ``IndexError`` if empty."""
+        possibilities = self.possibilities
+        n = len(possibilities)
+        if n == 0:
+            raise IndexError("cannot collapse an empty superposition")
+        randrange = random.randrange
+        if self._alias is None:
+            return [possibilities[randrange(n)] for _ in range(k)]
+        prob, alias = self._alias
+        rand = random.random
+        draws = []
+        for _ in range(k):
+            i = randrange(n)
+            draws.append(possibilities[i if rand() < prob[i] else alias[i]])
+        return draws
 
 class SKICombinator:
     """Implementation of SKI combinators for information processing."""
@@ -85,40 +229,286 @@ class SKICombinator:
         """Identity combinator"""
         return x
 
+    # Term-graph API: programs as SKI graphs reduced by a shared machine
+    machine = ski_graph.SKIMachine()
+
+    @staticmethod
+    def term(source: str, **env: Any) -> ski_graph.Node:
+        """Compile a lambda-style expression (``\\x y. x``) into an SKI term graph."""
+        return ski_graph.translate(source, env)
+
+    def reduce(self, term: ski_graph.Node, max_steps: Optional[int] = None) -> ski_graph.Node:
+        """Graph-reduce a term to normal form (memoized by term hash)."""
+        return self.machine.reduce(term, max_steps)
+
+    def evaluate(self, term: ski_graph.Node, max_steps: Optional[int] = None) -> Any:
+        """Reduce a term and return the Python value of a literal result."""
+        return self.machine.evaluate(term, max_steps)
+
+@dataclass
+class SortReport:
+    """Outcome of one batched demon sort."""
+    thresholds: Tuple[float, ...]
+    counts: List[int]
+    histogram: List[int]
+    bin_edges: List[float]
+
+def energy_histogram(energies: Sequence[float], bins: int = 10) -> Tuple[List[int], List[float]]:
+    """Equal-width histogram of energies over their own [min, max] range."""
+    if not len(energies):
+        return [0] * bins, []
+    if np is not None:
+        counts, edges = np.histogram(np.asarray(energies, dtype=float), bins=bins)
+        return counts.tolist(), edges.tolist()
+    low, high = min(energies), max(energies)
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    width = (high - low) / bins
+    counts = [0] * bins
+    for energy in energies:
+        counts[min(int((energy - low) / width), bins - 1)] += 1
+    return counts, [low + i * width for i in range(bins + 1)]
+
 class MaxwellDemon:
     """Information sorter based on Maxwell's Demon concept."""
-    def __init__(self, energy_threshold: float = 0.5):
-        self.energy_threshold = energy_threshold
-        self.high_energy: Deque[Any] = deque()
-        self.low_energy: Deque[Any] = deque()
+    def __init__(
+        self,
+        energy_threshold: float = 0.5,
+        thresholds: Optional[Sequence[float]] = None,
+        capacity: Optional[int] = None,
+    ):
+        """
+        :param energy_threshold: Single high/low cut (used when ``thresholds`` is omitted)
+        :param thresholds: Ascending cuts defining ``len(thresholds) + 1`` buckets
+        :param capacity: Keep only the newest ``capacity`` particles per bucket
+        """
+        self.thresholds: Tuple[float, ...] = tuple(sorted(thresholds)) if thresholds else (energy_threshold,)
+        self.energy_threshold = self.thresholds[0]
+        self.capacity = capacity
+        self.buckets: List[Deque[Any]] = [
+            deque(maxlen=capacity) for _ in range(len(self.thresholds) + 1)
+        ]
+        self.low_energy: Deque[Any] = self.buckets[0]
+        self.high_energy: Deque[Any] = self.buckets[-1]
+
+    def bucket_of(self, energy: float) -> int:
+        """Index of the bucket an energy falls in; a cut value sorts low."""
+        return bisect_left(self.thresholds, energy)
 
     def sort(self, particle: Any, energy: float) -> None:
-        if energy > self.energy_threshold:
-            self.high_energy.append(particle)
+        self.buckets[bisect_left(self.thresholds, energy)].append(particle)
+
+    def sort_batch(
+        self,
+        particles: Sequence[Any],
+        energies: Union[Sequence[float], Callable[[Any], float]],
+        bins: int = 10,
+    ) -> SortReport:
+        """
+        Partition a whole batch of particles in one pass.
+
+        :param particles: Items to sort
+        :param energies: Energy per particle, or an energy function to evaluate
+        :param bins: Number of bins in the reported energy histogram
+        :return: Per-bucket counts and the batch energy histogram
+        """
+        if callable(energies):
+            energies = [energies(particle) for particle in particles]
+        if len(energies) != len(particles):
+            raise ValueError("particles and energies must have the same length")
+
+        if np is not None and len(particles):
+            energy_array = np.asarray(energies, dtype=float)
+            indices = np.searchsorted(np.asarray(self.thresholds), energy_array, side="left")
+            counts = np.bincount(indices, minlength=len(self.buckets)).tolist()
+            # gather by index: an object array built from tuple/list particles
+            # would be broadcast into extra dimensions instead of holding them
+            for b, bucket in enumerate(self.buckets):
+                if counts[b]:
+                    bucket.extend(particles[i] for i in np.flatnonzero(indices == b).tolist())
         else:
-            self.low_energy.append(particle)
+            counts = [0] * len(self.buckets)
+            appends = [bucket.append for bucket in self.buckets]
+            thresholds = self.thresholds
+            if len(thresholds) == 1:
+                cut, low, high = thresholds[0], appends[0], appends[1]
+                high_count = 0
+                for particle, energy in zip(particles, energies):
+                    if energy > cut:
+                        high(particle)
+                        high_count += 1
+                    else:
+                        low(particle)
+                counts = [len(particles) - high_count, high_count]
+            else:
+                for particle, energy in zip(particles, energies):
+                    b = bisect_left(thresholds, energy)
+                    appends[b](particle)
+                    counts[b] += 1
+
+        histogram, edges = energy_histogram(energies, bins)
+        return SortReport(self.thresholds, counts, histogram, edges)
+
+    def get_buckets(self) -> Tuple[Deque[Any], ...]:
+        """All buckets, lowest energy first."""
+        return tuple(self.buckets)
 
     def get_sorted(self) -> Tuple[Deque[Any], Deque[Any]]:
         return self.high_energy, self.low_energy
 
+class LRUCache:
+    """Small thread-safe bounded LRU mapping."""
+    def __init__(self, maxsize: int = 65536):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_many(self, keys: Iterable[Any]) -> Dict[Any, Any]:
+        """Look up several keys under one lock acquisition; returns only the hits."""
+        found = {}
+        with self._lock:
+            data = self._data
+            for key in keys:
+                try:
+                    found[key] = data[key]
+                except KeyError:
+                    self.misses += 1
+                    continue
+                data.move_to_end(key)
+            self.hits += len(found)
+        return found
+
+    def put_many(self, items: Iterable[Tuple[Any, Any]]) -> None:
+        """Store several entries under one lock acquisition."""
+        with self._lock:
+            data = self._data
+            for key, value in items:
+                data[key] = value
+                data.move_to_end(key)
+            while len(data) > self.maxsize:
+                data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
 class QuantumProcessor:
     """Main quantum information processing system."""
+    # the combinator apply_ski wraps around a transform: t |-> S (K t) I
+    APPLY = ski_graph.translate(r"\t. S (K t) I")
+    _shapes = LRUCache(maxsize=256)
+
     def __init__(self):
         self.ski = SKICombinator()
         self.demon = MaxwellDemon()
         self._collapsed = False
 
+    @classmethod
+    def combinator_shape(cls, combinator: ski_graph.Node) -> str:
+        """
+        Classify ``combinator t x`` by symbolic reduction with free ``t`` and ``x``.
+
+        :return: ``"apply"`` if it is provably ``t x``, ``"identity"`` if it is
+            provably ``x``, otherwise ``"opaque"``
+        """
+        digest, _ = ski_graph.term_digest(combinator)
+        cached = cls._shapes.get(digest)
+        if cached is not None:
+            return cached[1]
+        t, x = ski_graph.free("t"), ski_graph.free("x")
+        machine = ski_graph.SKIMachine(memo_size=0)
+        try:
+            head, args = ski_graph.unwind(
+                machine.normalize(ski_graph.app(combinator, t, x), max_steps=10_000)
+            )
+        except ski_graph.ReductionLimitExceeded:
+            head, args = None, None
+        if head is t and len(args) == 1 and args[0] is x:
+            shape = "apply"
+        elif head is x and not args:
+            shape = "identity"
+        else:
+            shape = "opaque"
+        # keep the term alive so primitive ids inside its digest cannot be reused
+        cls._shapes.put(digest, (combinator, shape))
+        return shape
+
+    def apply_ski_many(
+        self,
+        values: Sequence[T],
+        transform: Callable[[T], S],
+        combinator: Optional[ski_graph.Node] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[S]:
+        """
+        Batch form of ``apply_ski``.
+
+        When the combinator is provably identity-shaped (``c t x = t x`` or
+        ``c t x = x``) the term plumbing is skipped and ``transform`` is mapped
+        directly, optionally over a process pool for expensive transforms.
+        Other combinators are reduced per value on the term graph.
+
+        :param values: Inputs to transform
+        :param transform: Function applied through the combinator
+        :param combinator: Term taking ``transform`` then a value; defaults to ``S (K t) I``
+        :param max_workers: Map over this many processes when the transform can be pickled
+        """
+        combinator = self.APPLY if combinator is None else combinator
+        shape = self.combinator_shape(combinator)
+        if shape == "identity":
+            return list(values)
+        if shape == "apply":
+            if max_workers and max_workers > 1 and len(values) > 1:
+                try:
+                    pickle.dumps(transform)
+                except (pickle.PicklingError, AttributeError, TypeError):
+                    pass  # e.g. a lambda; map serially below
+                else:
+                    chunksize = max(1, len(values) // (max_workers * 4))
+                    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                        return list(executor.map(transform, values, chunksize=chunksize))
+            return list(map(transform, values))
+        primitive = ski_graph.prim(transform)
+        normalize = self.ski.machine.normalize
+        return [
+            ski_graph.to_python(normalize(ski_graph.app(combinator, primitive, ski_graph.lit(value))))
+            for value in values
+        ]
+
     def apply_ski(self, data: T, transform: Callable[[T], S]) -> S:
-        """Apply SKI combinator transformation."""
-        def transformed_func(x):
-            transformed = transform(x)
-            return lambda _: transformed
-
-        return self.ski.S(
-            transformed_func,
-            self.ski.I,
-            data
+        """Apply SKI combinator transformation by reducing ``S (K transform) I data``."""
+        term = ski_graph.app(
+            ski_graph.S,
+            ski_graph.app(ski_graph.K, ski_graph.prim(transform)),
+            ski_graph.I,
+            ski_graph.lit(data),
         )
+        # primitive terms are never memoized, so skip hashing and normalize directly
+        return ski_graph.to_python(self.ski.machine.normalize(term))
 
     def measure(self, quantum_state: QuantumState) -> T:
         """Collapse the quantum state to a single outcome."""
@@ -128,6 +518,119 @@ class QuantumProcessor:
         """Convert data into a quantum superposition."""
         return QuantumState(data)
 
+def _run_operations(operations: Tuple[Callable[[str], str], ...], chunk: List[str]) -> List[Tuple[str, str]]:
+    """Process-pool worker: run a chain over a chunk, returning (data, hash) pairs."""
+    results = []
+    for data in chunk:
+        for operation in operations:
+            data = operation(data)
+        results.append((data, hash_data(data)))
+    return results
+
+class TransformChain:
+    """
+    A morph operation list compiled once into a single callable.
+
+    Results are memoized in a shared bounded LRU keyed by
+    ``(chain_id, input)``; the input string is its own key, so a lookup
+    costs a dict probe rather than a hash of the data. Operations are
+    assumed to be pure ``str -> str`` functions.
+    """
+    results = LRUCache(maxsize=65536)
+    _compiled = LRUCache(maxsize=256)
+    _ids = itertools.count()
+    parallel_threshold = 4096
+
+    def __init__(self, operations: Sequence[Callable[[str], str]]):
+        self.operations: Tuple[Callable[[str], str], ...] = tuple(operations)
+        self.chain_id = next(TransformChain._ids)
+        self.function = self._compose(self.operations)
+
+    @staticmethod
+    def _compose(operations: Tuple[Callable[[str], str], ...]) -> Callable[[str], str]:
+        if not operations:
+            return lambda data: data
+        if len(operations) == 1:
+            return operations[0]
+
+        def composed(data: str) -> str:
+            for operation in operations:
+                data = operation(data)
+            return data
+        return composed
+
+    @classmethod
+    def compile(cls, operations: Sequence[Callable[[str], str]]) -> 'TransformChain':
+        """Return the chain for this exact operation sequence, compiling it once."""
+        key = tuple(operations)
+        chain = cls._compiled.get(key)
+        if chain is None:
+            chain = cls(key)
+            cls._compiled.put(key, chain)
+        return chain
+
+    def apply(self, data: str) -> Tuple[str, str]:
+        """Morph ``data``; returns ``(data, hash)``."""
+        key = (self.chain_id, data)
+        result = TransformChain.results.get(key)
+        if result is None:
+            morphed = self.function(data)
+            result = (morphed, hash_data(morphed))
+            TransformChain.results.put(key, result)
+        return result
+
+    def __call__(self, data: str) -> str:
+        return self.apply(data)[0]
+
+    def map(self, inputs: Sequence[str], max_workers: Optional[int] = None) -> List[Tuple[str, str]]:
+        """
+        Batch morph: deduplicate, serve cache hits, and compute the misses.
+
+        A batch with more distinct inputs than the cache holds would only
+        evict itself, so it skips the cache altogether. Misses are split
+        across a process pool when there are at least ``parallel_threshold``
+        of them and the operations can be pickled; otherwise they run
+        serially in this process.
+
+        :param inputs: Raw inputs, duplicates welcome
+        :param max_workers: Worker processes (defaults to CPU count; 1 forces serial)
+        :return: ``(data, hash)`` per input, in input order
+        """
+        unique = list(dict.fromkeys(inputs))
+        cache = TransformChain.results
+        chain_id = self.chain_id
+        memoize = len(unique) <= cache.maxsize
+        if memoize:
+            hits = cache.get_many((chain_id, data) for data in unique)
+            resolved = {key[1]: result for key, result in hits.items()}
+            todo = [data for data in unique if data not in resolved] if resolved else unique
+        else:
+            resolved, todo = {}, unique
+
+        if todo:
+            workers = max_workers or os.cpu_count() or 1
+            computed = None
+            if workers > 1 and len(todo) >= self.parallel_threshold:
+                computed = self._map_parallel(todo, workers)
+            if computed is None:
+                computed = _run_operations(self.operations, todo)
+            resolved.update(zip(todo, computed))
+            if memoize:
+                cache.put_many(((chain_id, data), result) for data, result in zip(todo, computed))
+
+        return [resolved[data] for data in inputs]
+
+    def _map_parallel(self, todo: List[str], workers: int) -> Optional[List[Tuple[str, str]]]:
+        try:
+            pickle.dumps(self.operations)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return None  # e.g. lambdas; fall back to serial
+        size = -(-len(todo) // (workers * 4))
+        chunks = [todo[i:i + size] for i in range(0, len(todo), size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = executor.map(_run_operations, itertools.repeat(self.operations), chunks)
+            return [result for part in parts for result in part]
+
 @dataclass
 class MorphologicalNode:
     """Value Node with Dynamic Capabilities"""
@@ -144,16 +647,23 @@ class MorphologicalNode:
         """Calculate hash of data, reflects state."""
         return hash_data(input_data)
 
+    @classmethod
+    def morphed(cls, data: str, digest: str,
+                morph_operations: List[Callable[[str], str]]) -> 'MorphologicalNode':
+        """Build a node from an already-morphed ``(data, hash)`` without rerunning the chain."""
+        node = cls.__new__(cls)
+        node.data, node.hash, node.morph_operations = data, digest, morph_operations
+        return node
+
     def morph(self) -> None:
         """Simulate adapting to its environment via self-reflection."""
-        for operation in self.morph_operations:
-            self.data = operation(self.data)
+        self.data = TransformChain.compile(self.morph_operations)(self.data)
 
     def reflect_and_morph(self) -> None:
-        """Run self-modifications and update hash."""
+        """Run self-modifications and update hash (memoized per chain and input)."""
         if self.morph_operations:
-            self.morph()
-            self.hash = self.calculate_hash(self.data)
+            chain = TransformChain.compile(self.morph_operations)
+            self.data, self.hash = chain.apply(self.data)
 
 @dataclass
 class InternalNode:
@@ -164,31 +674,182 @@ class InternalNode:
 
     def __post_init__(self):
         """Calculate hash by combining left and right node hashes."""
+        self.rehash()
+
+    @classmethod
+    def with_hash(cls, left, right, digest: str) -> 'InternalNode':
+        """Build a node whose hash was already computed elsewhere."""
+        node = cls.__new__(cls)
+        node.left, node.right, node.hash = left, right, digest
+        return node
+
+    def rehash(self) -> None:
+        """Recompute the hash from the current child hashes."""
         combined = self.left.hash + (self.right.hash if self.right else '')
         self.hash = hash_data(combined)
 
+def _hash_levels(hashes: List[str], depth: int) -> List[List[str]]:
+    """Process-pool worker: hash ``depth`` levels above an aligned block of leaf hashes."""
+    levels = []
+    for _ in range(depth):
+        hashes = [
+            hash_data(hashes[i] + (hashes[i + 1] if i + 1 < len(hashes) else ''))
+            for i in range(0, len(hashes), 2)
+        ]
+        levels.append(hashes)
+    return levels
+
 class MorphologicalTree:
     """Advanced Tree Structure for Morphological Transformations"""
-    def __init__(self, data_chunks: List[str], transformations: List[Callable[[str], str]]):
+    parallel_threshold = 1 << 15
+    def __init__(self, data_chunks: List[str], transformations: List[Callable[[str], str]],
+                 max_workers: Optional[int] = None, checkpoint_budget: int = 32 << 20):
         """
         Initialize a MorphologicalTree with data chunks and transformation operations.
         
         :param data_chunks: List of initial data to create leaf nodes
         :param transformations: List of transformation functions to apply to nodes
+        :param max_workers: Worker processes for batch morphing large leaf sets
+        :param checkpoint_budget: Approximate bytes of per-stage leaf data kept
+            so that changing transformation k only reruns stages k..n (0 keeps
+            none). The first build runs the whole chain at once; checkpoints
+            are filled by the first ``replace_transformation``
         """
-        self.leaves = [MorphologicalNode(data, morph_operations=transformations) for data in data_chunks]
+        self.transformations = list(transformations)
+        self.max_workers = max_workers
+        self.checkpoint_budget = checkpoint_budget
+        self.inputs = list(data_chunks)
+        self._checkpoints: Dict[int, List[str]] = {}
+        values, digests = self._run_stages(0, self.inputs, checkpoint=False)
+        self.leaves = [
+            MorphologicalNode.morphed(data, digest, self.transformations)
+            for data, digest in zip(values, digests)
+        ]
         self.root = self.build_tree(self.leaves)
 
-    def build_tree(self, nodes: List[MorphologicalNode]) -> InternalNode:
+    @staticmethod
+    def _stage_size(values: List[str]) -> int:
+        return sum(map(len, values)) + 8 * len(values)
+
+    def _store_checkpoint(self, stage: int, values: List[str]) -> None:
+        """Keep an intermediate stage, evicting the oldest stages over budget."""
+        if stage >= len(self.transformations):
+            return  # the final stage lives in the leaves
+        size = self._stage_size(values)
+        if size > self.checkpoint_budget:
+            return
+        self._checkpoints[stage] = values
+        used = sum(self._stage_size(v) for v in self._checkpoints.values())
+        for old in sorted(self._checkpoints):
+            if used <= self.checkpoint_budget:
+                break
+            used -= self._stage_size(self._checkpoints.pop(old))
+
+    def _run_stages(self, start: int, values: List[str],
+                    checkpoint: bool = True) -> Tuple[List[str], List[str]]:
+        """
+        Run transformations[start:] over per-leaf stage values.
+
+        :param checkpoint: Run stage by stage, keeping checkpoints within the
+            budget; otherwise the whole chain runs at once through the memo
+        :return: Final per-leaf data and their hashes
+        """
+        operations = self.transformations[start:]
+        if not operations:
+            return values, [hash_data(data) for data in values]
+        if not checkpoint or self.checkpoint_budget <= 0:
+            results = TransformChain.compile(operations).map(values, self.max_workers)
+            return [data for data, _ in results], [digest for _, digest in results]
+
+        # stage values stay in this tree's own checkpoints: they are neither
+        # hashed nor put in the shared TransformChain memo, only the final data is
+        for stage, operation in enumerate(operations, start + 1):
+            results = {data: operation(data) for data in dict.fromkeys(values)}
+            values = [results[data] for data in values]
+            self._store_checkpoint(stage, values)
+        digests = {data: hash_data(data) for data in dict.fromkeys(values)}
+        return values, [digests[data] for data in values]
+
+    def _remorph_from(self, stage: int, values: Optional[List[str]] = None) -> List[int]:
+        """
+        Rerun stages ``stage..n`` and rehash dirty paths.
+
+        :param values: The leaf values entering ``stage``, if known; otherwise
+            the run starts from the nearest checkpoint (or the inputs)
+        """
+        for old in [s for s in self._checkpoints if s > stage]:
+            del self._checkpoints[old]
+        if values is not None:
+            start = stage
+        else:
+            start = max((s for s in self._checkpoints if s <= stage), default=0)
+            values = self._checkpoints[start] if start else self.inputs
+        new_values, digests = self._run_stages(start, values)
+
+        changed = []
+        for i, (leaf, data, digest) in enumerate(zip(self.leaves, new_values, digests)):
+            if leaf.hash != digest:
+                leaf.data, leaf.hash = data, digest
+                changed.append(i)
+        self._rehash_paths(changed)
+        return changed
+
+    def _rehash_paths(self, changed: List[int]) -> None:
+        """Recompute only the internal nodes above the changed leaves."""
+        dirty = set(changed)
+        for level in self.levels[1:]:
+            dirty = {i // 2 for i in dirty}
+            for i in dirty:
+                level[i].rehash()
+            if not dirty:
+                break
+
+    def replace_transformation(self, index: int, operation: Callable[[str], str]) -> List[int]:
+        """
+        Replace transformation ``index`` and rerun only the stages after it.
+
+        :return: Indices of the leaves whose data changed
+        """
+        self.transformations[index] = operation
+        return self._remorph_from(index % len(self.transformations))
+
+    def append_transformation(self, operation: Callable[[str], str]) -> List[int]:
+        """
+        Append a transformation, running only the new stage over the leaves.
+
+        The leaves already hold the output of the previous last stage, so no
+        checkpoint is needed.
+
+        :return: Indices of the leaves whose data changed
+        """
+        current = [leaf.data for leaf in self.leaves]
+        self.transformations.append(operation)
+        stage = len(self.transformations) - 1
+        self._store_checkpoint(stage, current)
+        return self._remorph_from(stage, current)
+
+    def build_tree(self, nodes: List[MorphologicalNode], max_workers: Optional[int] = None) -> InternalNode:
         """
-        Recursively build a binary tree from the input nodes.
+        Build a binary tree from the input nodes, level by level.
+
+        Large trees are split into aligned power-of-two blocks whose lower
+        levels are hashed on a process pool; the few levels near the root
+        are built serially. The root hash is identical either way.
+
+        The levels (leaves first, root last) are kept on ``self.levels`` so
+        that later changes can rehash just the affected paths.
         
         :param nodes: List of nodes to be organized into a tree
+        :param max_workers: Worker processes (defaults to the tree's setting; 1 forces serial)
         :return: Root node of the constructed tree
         """
         if not nodes:
             raise ValueError("Cannot build tree with empty nodes list")
-        
+
+        workers = max_workers or getattr(self, 'max_workers', None) or os.cpu_count() or 1
+        self.levels = [nodes]
+        if workers > 1 and len(nodes) >= self.parallel_threshold:
+            nodes = self._build_lower_levels(nodes, workers)
         while len(nodes) > 1:
             new_level = []
             for i in range(0, len(nodes), 2):
@@ -198,32 +859,66 @@ class MorphologicalTree:
                     new_node = InternalNode(left=nodes[i])
                 new_level.append(new_node)
             nodes = new_level
+            self.levels.append(nodes)
         return nodes[0]
 
-    def print_node_info(self, node, prefix=""):
+    def _build_lower_levels(self, nodes: List[Any], workers: int) -> List[Any]:
+        """Hash the bottom levels in parallel blocks and link the nodes; returns the top level built."""
+        target = max(2, len(nodes) // (workers * 4))
+        block = 1 << (target.bit_length() - 1)  # power of two keeps blocks aligned
+        hashes = [node.hash for node in nodes]
+        blocks = [hashes[i:i + block] for i in range(0, len(hashes), block)]
+        depth = block.bit_length() - 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            block_levels = list(executor.map(_hash_levels, blocks, itertools.repeat(depth)))
+
+        for level in range(depth):
+            digests = [digest for levels in block_levels for digest in levels[level]]
+            new_level = []
+            for j, i in enumerate(range(0, len(nodes), 2)):
+                right = nodes[i + 1] if i + 1 < len(nodes) else None
+                new_level.append(InternalNode.with_hash(nodes[i], right, digests[j]))
+            nodes = new_level
+            self.levels.append(nodes)
+        return nodes
+
+    @staticmethod
+    def _children(node) -> List[Any]:
+        if isinstance(node, InternalNode):
+            return [node.left, node.right] if node.right else [node.left]
+        return []
+
+    def _render(self, renderer: TreeRenderer, node, prefix: str = "") -> None:
+        def label(n) -> str:
+            if isinstance(n, InternalNode):
+                return f"Internal Node [Hash: {renderer.paint(n.hash, suffix='...')}]"
+            return f"Leaf Node [Data: {n.data}, Hash: {renderer.paint(n.hash, suffix='...')}]"
+
+        renderer.tree(node, self._children, label, prefix=prefix)
+
+    def print_node_info(self, node, prefix="", **render_options):
         """
-        Recursively print information about nodes in the tree.
+        Print information about the subtree rooted at ``node``.
         
         :param node: Current node to print information for
         :param prefix: Prefix for indentation and tree structure visualization
+        :param render_options: ``stream``, ``color``, ``max_depth``, ``max_width``
         """
-        if isinstance(node, InternalNode):
-            print(f"{prefix}Internal Node [Hash: {generate_color_from_hash(node.hash)}{node.hash[:8]}...\033[0m]")
-            print(f"{prefix}├── Left:")
-            self.print_node_info(node.left, prefix + "│   ")
-            if node.right:
-                print(f"{prefix}└── Right:")
-                self.print_node_info(node.right, prefix + "    ")
-        else:  # MorphologicalNode
-            print(f"{prefix}Leaf Node:")
-            print(f"{prefix}├── Data: {node.data}")
-            print(f"{prefix}└── Hash: {generate_color_from_hash(node.hash)}{node.hash[:8]}...\033[0m")
-
-    def visualize(self):
-        """Print a visual representation of the tree."""
-        print("\nTree Structure:")
-        print("==============")
-        self.print_node_info(self.root)
+        renderer = TreeRenderer(**render_options)
+        self._render(renderer, node, prefix)
+        renderer.flush()
+
+    def visualize(self, **render_options):
+        """
+        Print a visual representation of the tree with a single write.
+
+        :param render_options: ``stream``, ``color``, ``max_depth``, ``max_width``
+        """
+        renderer = TreeRenderer(**render_options)
+        renderer.line("\nTree Structure:")
+        renderer.line("==============")
+        self._render(renderer, self.root)
+        renderer.flush()
 
 class Morph:
     """Represents a morphable quantum state."""
@@ -232,12 +927,20 @@ class Morph:
         self.processor = processor
         self.history: List[T] = []
 
-    def transition(self, transform: Callable[[T], S]) -> None:
-        """Transition the state using a transformation function."""
-        self.state = QuantumState([
-            self.processor.apply_ski(possibility, transform)
-            for possibility in self.state.possibilities
-        ])
+    def transition(self, transform: Callable[[T], S], max_workers: Optional[int] = None) -> None:
+        """
+        Transition the state using a transformation function.
+
+        Every possibility is mapped once through ``apply_ski_many`` (which
+        skips the term plumbing for the default combinator) and the result
+        is stored, so measuring never reruns ``transform``. The existing state
+        is updated in place (amplitudes and any alias table are kept) rather
+        than allocating a new superposition; the old possibilities list is
+        not written to, since it may be the caller's data.
+        """
+        self.state.possibilities = self.processor.apply_ski_many(
+            self.state.possibilities, transform, max_workers=max_workers
+        )
 
     def measure(self) -> T:
         """Collapse the state to a single outcome."""
@@ -255,9 +958,7 @@ def transducer_pipeline(
     measured = processor.measure(quantum_state)
     transformed = processor.apply_ski(measured, lambda x: x * 2)
 
-    for item in data:
-        energy = energy_function(item)
-        processor.demon.sort(item, energy)
+    processor.demon.sort_batch(data, energy_function)
 
     return transformed, processor.demon.get_sorted()
 
@@ -276,6 +977,70 @@ def omega_pipeline(
 
     return final_state, sorted_states
 
+class StreamingTransducer:
+    """
+    Constant-memory measure/transform/sort pipeline over an iterable.
+
+    Items are pulled lazily, so unbounded event streams can be pushed through.
+    The measurement is a size-one reservoir sample (a uniform collapse over
+    everything seen so far), and the demon buckets are bounded deques.
+    """
+    def __init__(
+        self,
+        energy_function: Callable[[T], float],
+        transform: Optional[Callable[[T], S]] = None,
+        sinks: Optional[Sequence[Optional[Callable[[S], None]]]] = None,
+        demon: Optional[MaxwellDemon] = None,
+        retain: int = 1024,
+    ):
+        """
+        :param energy_function: Energy of a raw item, used for sorting
+        :param transform: Applied to each item before it is emitted (identity by default)
+        :param sinks: One callable per demon bucket (lowest first); ``None`` entries are skipped
+        :param demon: Sorter to use; defaults to a high/low demon retaining ``retain`` items per bucket
+        :param retain: Bucket capacity of the default demon
+        """
+        self.energy_function = energy_function
+        self.transform = transform
+        self.demon = demon if demon is not None else MaxwellDemon(capacity=retain)
+        if sinks is not None and len(sinks) != len(self.demon.buckets):
+            raise ValueError(f"Expected {len(self.demon.buckets)} sinks, got {len(sinks)}")
+        self.sinks = sinks
+        self.counts = [0] * len(self.demon.buckets)
+        self.seen = 0
+        self.measured: Optional[T] = None
+
+    def feed(self, item: T) -> Tuple[int, S]:
+        """Push one item through the stages; returns ``(bucket, emitted item)``."""
+        self.seen += 1
+        if random.randrange(self.seen) == 0:
+            self.measured = item
+        bucket = self.demon.bucket_of(self.energy_function(item))
+        emitted = self.transform(item) if self.transform is not None else item
+        self.demon.buckets[bucket].append(emitted)
+        self.counts[bucket] += 1
+        if self.sinks is not None and self.sinks[bucket] is not None:
+            self.sinks[bucket](emitted)
+        return bucket, emitted
+
+    def run(self, source: Iterable[T]) -> Iterator[Tuple[int, S]]:
+        """Lazily consume ``source``, yielding each item as soon as it is sorted."""
+        feed = self.feed
+        for item in source:
+            yield feed(item)
+
+def stream_pipeline(
+    source: Iterable[T],
+    energy_function: Callable[[T], float],
+    transform: Optional[Callable[[T], S]] = None,
+    sinks: Optional[Sequence[Optional[Callable[[S], None]]]] = None,
+    thresholds: Optional[Sequence[float]] = None,
+    retain: int = 1024,
+) -> Iterator[Tuple[int, S]]:
+    """Generator counterpart of ``omega_pipeline`` for unbounded iterables."""
+    demon = MaxwellDemon(thresholds=thresholds, capacity=retain)
+    yield from StreamingTransducer(energy_function, transform, sinks, demon).run(source)
+
 @dataclass
 class MerkleRingNode:
     """Represents a node in the Merkle Ring."""
@@ -348,10 +1113,25 @@ class MerkleRing:
             print(f"Error reading TOML file: {e}")
             return MerkleRing([])
 
-    def visualize(self):
-        """Display the structure of the Merkle Ring."""
-        for node in self.nodes:
-            print(node)
+    def visualize(self, **render_options):
+        """
+        Display the structure of the Merkle Ring with a single write.
+
+        :param render_options: ``stream``, ``color``, ``max_width``
+        """
+        renderer = TreeRenderer(**render_options)
+
+        def label(node: MerkleRingNode) -> str:
+            text = (
+                f"Node(Data: {node.data[:10]}, Hash: {node.hash[:6]}, "
+                f"Next Hash: {node.next_hash[:6]})"
+            )
+            if not renderer.color:
+                return text
+            return f"{generate_color_from_hash(node.hash)}{text}\033[0m"
+
+        renderer.items(self.nodes, label)
+        renderer.flush()
 
 def demo_transformations(input_data: str, transformations: List[Callable[[str], str]]) -> None:
     """
@@ -0,0 +1,175 @@
+"""
+Buffered ANSI Tree Renderer
+
+Shared rendering backend for the ``visualize()`` methods of the Merkle and
+morphological structures. Output is accumulated in memory and written to the
+stream in a single call, so large trees cost one I/O syscall instead of one
+per line.
+
+Key Concepts:
+- Hash-derived colors memoized by hash prefix
+- Depth and width limits with subtree elision
+- Plain (colorless) mode for non-TTY streams
+
+Dependencies: Python 3.13+ Standard Library
+"""
+
+import os
+import sys
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Sequence, TextIO
+
+RESET = "\033[0m"
+DEFAULT_COLOR = "\033[37m"
+
+@lru_cache(maxsize=4096)
+def color_for_prefix(prefix: str) -> str:
+    """Generate (and memoize) an ANSI color code from a 6-hex-char hash prefix."""
+    try:
+        color_value = int(prefix, 16)
+    except ValueError:
+        return DEFAULT_COLOR
+    r = (color_value >> 16) % 256
+    g = (color_value >> 8) % 256
+    b = color_value % 256
+    return f"\033[38;2;{r};{g};{b}m"
+
+def color_from_hash(hash_str: str) -> str:
+    """Generate an ANSI color code based on the hash string."""
+    return color_for_prefix(hash_str[:6])
+
+def supports_color(stream: TextIO) -> bool:
+    """Decide whether ANSI colors should be emitted to the given stream."""
+    if os.environ.get("NO_COLOR"):
+        return False
+    if os.environ.get("FORCE_COLOR"):
+        return True
+    isatty = getattr(stream, "isatty", None)
+    try:
+        return bool(isatty and isatty())
+    except ValueError:  # closed stream
+        return False
+
+class TreeRenderer:
+    """Accumulates a rendering in one buffer and writes it out once."""
+    BRANCH = "├── "
+    LAST = "└── "
+    PIPE = "│   "
+    SPACE = "    "
+    ELLIPSIS = "…"
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        color: Optional[bool] = None,
+        max_depth: Optional[int] = None,
+        max_width: Optional[int] = None,
+    ):
+        """
+        Initialize a renderer.
+
+        :param stream: Output stream (defaults to ``sys.stdout``)
+        :param color: Force colors on/off; ``None`` auto-detects a TTY
+        :param max_depth: Deepest level rendered; deeper subtrees are elided
+        :param max_width: Most children/items shown per node or sequence
+        """
+        self.stream = stream if stream is not None else sys.stdout
+        self.color = supports_color(self.stream) if color is None else color
+        self.max_depth = max_depth
+        self.max_width = max_width
+        self._lines: List[str] = []
+
+    def paint(self, hash_str: str, width: int = 8, suffix: str = "") -> str:
+        """Return a short hash, colored by its prefix unless in plain mode."""
+        text = f"{hash_str[:width]}{suffix}"
+        if not self.color:
+            return text
+        return f"{color_for_prefix(hash_str[:6])}{text}{RESET}"
+
+    def line(self, text: str = "") -> None:
+        """Append a line of text to the buffer."""
+        self._lines.append(text)
+
+    def _visible(self, count: int) -> int:
+        if self.max_width is None or count <= self.max_width:
+            return count
+        return max(self.max_width, 1)
+
+    def tree(
+        self,
+        root: Any,
+        children: Callable[[Any], Sequence[Any]],
+        label: Callable[[Any], str],
+        prefix: str = "",
+    ) -> None:
+        """
+        Render a tree iteratively (no recursion limit) into the buffer.
+
+        :param root: Root node to start from
+        :param children: Returns the ordered children of a node
+        :param label: Returns the one-line description of a node
+        :param prefix: Prefix prepended to every emitted line
+        """
+        lines = self._lines
+        # (node, line prefix, connector, child prefix, depth)
+        stack = [(root, prefix, "", prefix, 0)]
+        while stack:
+            node, line_prefix, connector, child_prefix, depth = stack.pop()
+            if node is None:  # elision marker, text carried in connector
+                lines.append(f"{line_prefix}{connector}")
+                continue
+            lines.append(f"{line_prefix}{connector}{label(node)}")
+
+            kids = children(node)
+            if not kids:
+                continue
+            if self.max_depth is not None and depth >= self.max_depth:
+                lines.append(
+                    f"{child_prefix}{self.LAST}{self.ELLIPSIS} "
+                    f"{len(kids)} subtree(s) elided"
+                )
+                continue
+
+            shown = self._visible(len(kids))
+            hidden = len(kids) - shown
+            pending = []
+            for i in range(shown):
+                last = i == shown - 1 and not hidden
+                pending.append((
+                    kids[i],
+                    child_prefix,
+                    self.LAST if last else self.BRANCH,
+                    child_prefix + (self.SPACE if last else self.PIPE),
+                    depth + 1,
+                ))
+            if hidden:
+                pending.append((
+                    None, child_prefix,
+                    f"{self.LAST}{self.ELLIPSIS} {hidden} more elided", "", depth + 1,
+                ))
+            stack.extend(reversed(pending))
+
+    def items(self, items: Sequence[Any], label: Callable[[Any], str], prefix: str = "") -> None:
+        """Render a flat sequence, eliding the middle past ``max_width``."""
+        shown = self._visible(len(items))
+        head = (shown + 1) // 2
+        tail = shown - head
+        for item in items[:head]:
+            self._lines.append(f"{prefix}{label(item)}")
+        if shown < len(items):
+            self._lines.append(f"{prefix}{self.ELLIPSIS} {len(items) - shown} elided")
+        if tail:
+            for item in items[len(items) - tail:]:
+                self._lines.append(f"{prefix}{label(item)}")
+
+    def getvalue(self) -> str:
+        """Return the buffered rendering as a single string."""
+        return "\n".join(self._lines) + "\n" if self._lines else ""
+
+    def flush(self) -> None:
+        """Write the whole buffer with a single ``write`` call and reset it."""
+        output = self.getvalue()
+        self._lines = []
+        if output:
+            self.stream.write(output)
+            self.stream.flush()
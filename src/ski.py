@@ -0,0 +1,435 @@
+"""
+SKI Combinator Graph Reduction Engine
+
+A term-graph representation of SKI combinator programs with an iterative
+graph-reduction evaluator, so combinator programs can be inspected,
+shared and optimized instead of being nested Python closures.
+
+Key Concepts:
+- Term graphs: application cells are rewritten in place, so a shared
+  subterm is reduced at most once (S duplicates a pointer, not a term)
+- Iterative spine unwinding: no Python recursion, arbitrarily deep programs
+- Strict primitives and literals for embedding Python functions and values
+- Merkle-style structural term hashes; normal forms memoized by hash
+- Bracket abstraction from lambda-style expressions (``\\x y. x``)
+
+Dependencies: Python 3.13+ Standard Library
+"""
+
+import re
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+# Node tags
+COMB, APP, IND, PRIM, LIT, VAR = range(6)
+
+class ReductionLimitExceeded(RuntimeError):
+    """Raised when a reduction exceeds its step budget (e.g. a non-terminating term)."""
+
+class Node:
+    """
+    A cell of the term graph.
+
+    ``COMB``: a = name; ``APP``: a = function, b = argument;
+    ``IND``: a = target (left behind by an in-place rewrite);
+    ``PRIM``: a = callable, b = arity; ``LIT``: a = value; ``VAR``: a = name.
+    """
+    __slots__ = ("tag", "a", "b")
+
+    def __init__(self, tag: int, a: Any = None, b: Any = None):
+        self.tag = tag
+        self.a = a
+        self.b = b
+
+    def __call__(self, *args: Any) -> 'Node':
+        """``f(x, y)`` builds the application ``f x y``."""
+        return app(self, *args)
+
+    def __repr__(self) -> str:
+        return f"Term({show(self)})"
+
+def _follow(node: Node) -> Node:
+    while node.tag == IND:
+        node = node.a
+    return node
+
+S = Node(COMB, "S")
+K = Node(COMB, "K")
+I = Node(COMB, "I")
+COMBINATORS = {"S": S, "K": K, "I": I}
+
+def term(value: Any) -> Node:
+    """Coerce a Python value into a term: nodes pass through, callables become primitives."""
+    if isinstance(value, Node):
+        return value
+    if callable(value):
+        return prim(value)
+    return lit(value)
+
+def app(function: Any, *args: Any) -> Node:
+    """Left-associated application ``function a1 a2 ...``."""
+    node = term(function)
+    for arg in args:
+        node = Node(APP, node, term(arg))
+    return node
+
+def lit(value: Any) -> Node:
+    """An opaque Python value."""
+    return Node(LIT, value)
+
+def prim(function: Callable[..., Any], arity: int = 1) -> Node:
+    """A strict Python primitive; fires once ``arity`` literal arguments are available."""
+    return Node(PRIM, function, arity)
+
+def free(name: str) -> Node:
+    """A free variable; irreducible, useful for symbolic reduction."""
+    return Node(VAR, name)
+
+def to_python(node: Node) -> Any:
+    """The Python value of a literal result, or the term itself."""
+    node = _follow(node)
+    return node.a if node.tag == LIT else node
+
+def unwind(node: Node) -> Tuple[Node, List[Node]]:
+    """Split a term into its head and its argument list (``f a b`` -> ``f, [a, b]``)."""
+    node = _follow(node)
+    args: List[Node] = []
+    while node.tag == APP:
+        args.append(_follow(node.b))
+        node = _follow(node.a)
+    args.reverse()
+    return node, args
+
+def show(node: Node, limit: int = 200) -> str:
+    """Render a term in applicative notation (iteratively, truncated to ``limit`` chars)."""
+    out: List[str] = []
+    todo: List[Union[Node, str]] = [node]
+    size = 0
+    while todo and size < limit:
+        item = todo.pop()
+        if isinstance(item, str):
+            out.append(item)
+            size += len(item)
+            continue
+        item = _follow(item)
+        if item.tag == APP:
+            arg = _follow(item.b)
+            if arg.tag == APP:
+                todo.extend([")", item.b, " (", item.a])
+            else:
+                todo.extend([item.b, " ", item.a])
+            continue
+        if item.tag == COMB or item.tag == VAR:
+            text = item.a
+        elif item.tag == LIT:
+            text = repr(item.a)
+        else:
+            text = f"<{getattr(item.a, '__name__', 'prim')}/{item.b}>"
+        out.append(text)
+        size += len(text)
+    text = "".join(out)
+    return text if not todo else text[:limit] + "…"
+
+def term_digest(node: Node) -> Tuple[str, bool]:
+    """
+    Structural SHA-256 of a term (computed bottom-up, iteratively).
+
+    :return: The hex digest and whether the term contains primitives
+    """
+    digests: Dict[int, str] = {}
+    has_prim = False
+    todo = [_follow(node)]
+    while todo:
+        current = todo[-1]
+        key = id(current)
+        if key in digests:
+            todo.pop()
+            continue
+        tag = current.tag
+        if tag == APP:
+            f, x = _follow(current.a), _follow(current.b)
+            missing = [child for child in (f, x) if id(child) not in digests]
+            if missing:
+                todo.extend(missing)
+                continue
+            payload = f"A{digests[id(f)]}{digests[id(x)]}"
+        elif tag == COMB:
+            payload = f"C{current.a}"
+        elif tag == VAR:
+            payload = f"V{current.a}"
+        elif tag == LIT:
+            payload = f"L{type(current.a).__qualname__}:{current.a!r}"
+        else:
+            has_prim = True
+            payload = f"P{getattr(current.a, '__qualname__', '')}:{id(current.a)}/{current.b}"
+        digests[key] = hashlib.sha256(payload.encode()).hexdigest()
+        todo.pop()
+    return digests[id(_follow(node))], has_prim
+
+class SKIMachine:
+    """Graph-reduction evaluator with a bounded memo of normal forms."""
+    def __init__(self, memo_size: int = 4096, memoize_primitives: bool = False):
+        """
+        :param memo_size: Number of normal forms kept, keyed by term hash
+        :param memoize_primitives: Also memoize terms containing primitives
+            (only safe when every primitive is a pure function)
+        """
+        self.memo_size = memo_size
+        self.memoize_primitives = memoize_primitives
+        self._memo: "OrderedDict[str, Tuple[Node, Node]]" = OrderedDict()
+        self.steps = 0
+
+    def _rewrite(self, redex: Node, result: Node) -> None:
+        redex.tag, redex.a, redex.b = IND, result, None
+        self.steps += 1
+
+    def whnf(self, root: Node, max_steps: Optional[int] = None) -> Node:
+        """
+        Reduce ``root`` in place to weak head normal form.
+
+        Primitive arguments are themselves brought to WHNF through an explicit
+        frame stack rather than recursion.
+        """
+        limit = None if max_steps is None else self.steps + max_steps
+        frames: List[Tuple[List[Node], Node, int]] = []
+        stack: List[Node] = []
+        node = _follow(root)
+        resume = 0
+        while True:
+            if limit is not None and self.steps > limit:
+                raise ReductionLimitExceeded(f"no normal form within {max_steps} steps")
+            tag = node.tag
+            if tag == APP:
+                stack.append(node)
+                node = _follow(node.a)
+                continue
+            n = len(stack)
+            if tag == COMB:
+                name = node.a
+                if name == "I" and n >= 1:
+                    redex = stack.pop()
+                    node = _follow(redex.b)
+                    self._rewrite(redex, node)
+                    continue
+                if name == "K" and n >= 2:
+                    x = stack[-1].b
+                    redex = stack[-2]
+                    del stack[-2:]
+                    node = _follow(x)
+                    self._rewrite(redex, node)
+                    continue
+                if name == "S" and n >= 3:
+                    f, g, redex = stack[-1].b, stack[-2].b, stack[-3]
+                    x = redex.b
+                    del stack[-3:]
+                    redex.a = Node(APP, f, x)
+                    redex.b = Node(APP, g, x)  # x is shared, not copied
+                    self.steps += 1
+                    node = redex
+                    continue
+            elif tag == PRIM and n >= node.b:
+                arity = node.b
+                index = resume
+                resume = 0
+                while index < arity:
+                    arg = _follow(stack[-1 - index].b)
+                    if arg.tag == APP:
+                        break
+                    index += 1
+                if index < arity:
+                    # evaluate the argument first; come back to this primitive afterwards
+                    frames.append((stack, node, index + 1))
+                    stack, node = [], arg
+                    continue
+                values = [_follow(stack[-1 - i].b) for i in range(arity)]
+                if all(value.tag == LIT for value in values):
+                    redex = stack[-arity]
+                    del stack[-arity:]
+                    result = node.a(*(value.a for value in values))
+                    node = result if isinstance(result, Node) else lit(result)
+                    self._rewrite(redex, node)
+                    continue
+            # head normal form: resume a suspended primitive, or finish
+            if frames:
+                stack, node, resume = frames.pop()
+                continue
+            return _follow(root)
+
+    def normalize(self, root: Node, max_steps: Optional[int] = None) -> Node:
+        """Reduce ``root`` in place to full normal form (normal order)."""
+        limit = None if max_steps is None else self.steps + max_steps
+        seen = set()
+        todo = [root]
+        while todo:
+            budget = None if limit is None else max(limit - self.steps, 0)
+            node = self.whnf(todo.pop(), budget)
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            spine = node
+            while spine.tag == APP:
+                todo.append(spine.b)
+                spine = _follow(spine.a)
+        return _follow(root)
+
+    def reduce(self, root: Node, max_steps: Optional[int] = None) -> Node:
+        """
+        Normal form of ``root``, served from the memo when the same term was
+        reduced before. The graph is rewritten in place.
+        """
+        digest, has_prim = term_digest(root)
+        cacheable = self.memo_size > 0 and (self.memoize_primitives or not has_prim)
+        if cacheable:
+            hit = self._memo.get(digest)
+            if hit is not None:
+                self._memo.move_to_end(digest)
+                return hit[1]
+        result = self.normalize(root, max_steps)
+        if cacheable:
+            # keep the source term alive so ids inside its digest cannot be reused
+            self._memo[digest] = (root, result)
+            if len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return result
+
+    def evaluate(self, root: Node, max_steps: Optional[int] = None) -> Any:
+        """Reduce and convert the result to a Python value when it is a literal."""
+        return to_python(self.reduce(root, max_steps))
+
+# Lambda-style expressions and bracket abstraction
+
+@dataclass(frozen=True)
+class Var:
+    name: str
+
+@dataclass(frozen=True)
+class Lam:
+    param: str
+    body: Any
+
+@dataclass(frozen=True)
+class Ap:
+    fun: Any
+    arg: Any
+
+Lambda = Union[Var, Lam, Ap, Node]
+
+def _free_in(name: str, expr: Any) -> bool:
+    todo = [expr]
+    while todo:
+        current = todo.pop()
+        if isinstance(current, Var):
+            if current.name == name:
+                return True
+        elif isinstance(current, Ap):
+            todo.extend((current.fun, current.arg))
+        elif isinstance(current, Lam):
+            if current.param != name:
+                todo.append(current.body)
+    return False
+
+def _abstract(name: str, expr: Any) -> Any:
+    """Bracket abstraction ``[name] expr`` over a lambda-free expression."""
+    if isinstance(expr, Var) and expr.name == name:
+        return I
+    if not _free_in(name, expr):
+        return Ap(K, expr)
+    # expr is an application containing ``name``
+    if isinstance(expr.arg, Var) and expr.arg.name == name and not _free_in(name, expr.fun):
+        return expr.fun  # eta: [x] (e x) = e
+    return Ap(Ap(S, _abstract(name, expr.fun)), _abstract(name, expr.arg))
+
+def _eliminate(expr: Any) -> Any:
+    """Remove every lambda, innermost first."""
+    if isinstance(expr, Lam):
+        return _abstract(expr.param, _eliminate(expr.body))
+    if isinstance(expr, Ap):
+        return Ap(_eliminate(expr.fun), _eliminate(expr.arg))
+    return expr
+
+def compile_lambda(expr: Lambda, env: Optional[Mapping[str, Any]] = None) -> Node:
+    """
+    Translate a lambda expression into an SKI term graph.
+
+    Free names resolve through ``env`` (values become literals, callables
+    primitives), then to the S/K/I combinators, and otherwise stay free
+    variables.
+    """
+    env = env or {}
+    flat = _eliminate(expr)
+
+    def build(current: Any) -> Node:
+        if isinstance(current, Ap):
+            return Node(APP, build(current.fun), build(current.arg))
+        if isinstance(current, Var):
+            if current.name in env:
+                return term(env[current.name])
+            return COMBINATORS.get(current.name) or free(current.name)
+        return term(current)
+    return build(flat)
+
+_TOKEN = re.compile(r"\s*(?:(?P<lam>[\\λ])|(?P<dot>\.)|(?P<open>\()|(?P<close>\))|(?P<name>[A-Za-z_][A-Za-z0-9_']*))")
+
+def parse_lambda(source: str) -> Lambda:
+    """
+    Parse ``\\x y. body`` / ``λx. body`` syntax with left-associative application.
+    """
+    tokens: List[Tuple[str, str]] = []
+    pos = 0
+    source = source.rstrip()
+    while pos < len(source):
+        match = _TOKEN.match(source, pos)
+        if not match:
+            raise SyntaxError(f"Unexpected character at {pos}: {source[pos]!r}")
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+        pos = match.end()
+
+    index = 0
+
+    def peek() -> Optional[str]:
+        return tokens[index][0] if index < len(tokens) else None
+
+    def expect(kind: str) -> str:
+        nonlocal index
+        if peek() != kind:
+            raise SyntaxError(f"Expected {kind} at token {index}")
+        index += 1
+        return tokens[index - 1][1]
+
+    def expression() -> Lambda:
+        nonlocal index
+        if peek() == "lam":
+            index += 1
+            params = [expect("name")]
+            while peek() == "name":
+                params.append(expect("name"))
+            expect("dot")
+            body = expression()
+            for param in reversed(params):
+                body = Lam(param, body)
+            return body
+        result = None
+        while peek() in ("name", "open", "lam"):
+            if peek() == "lam":
+                atom = expression()
+            elif peek() == "name":
+                atom = Var(expect("name"))
+            else:
+                index += 1
+                atom = expression()
+                expect("close")
+            result = atom if result is None else Ap(result, atom)
+        if result is None:
+            raise SyntaxError(f"Expected an expression at token {index}")
+        return result
+
+    expr = expression()
+    if index != len(tokens):
+        raise SyntaxError(f"Unexpected trailing input at token {index}")
+    return expr
+
+def translate(source: str, env: Optional[Mapping[str, Any]] = None) -> Node:
+    """Parse and compile a lambda-style expression into an SKI term graph."""
+    return compile_lambda(parse_lambda(source), env)
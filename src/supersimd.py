@@ -10,17 +10,15 @@ import queue
 import time
 import struct
 
+try:
+    from .render import TreeRenderer, color_from_hash
+except ImportError:  # executed as a script from within src/
+    from render import TreeRenderer, color_from_hash
+
 # Color and Hashing Utilities (maintained from original implementation)
 def generate_color_from_hash(hash_str: str) -> str:
     """Generate an ANSI escape color code based on the first 6 characters of a hash."""
-    try:
-        color_value = int(hash_str[:6], 16)  # Convert the first 6 chars to an integer
-        r = (color_value >> 16) % 256
-        g = (color_value >> 8) % 256
-        b = color_value % 256
-        return f"\033[38;2;{r};{g};{b}m"  # ANSI color escape sequence
-    except (ValueError, IndexError):
-        return "\033[37m"  # Default to white if hash is invalid
+    return color_from_hash(hash_str)  # memoized; white if hash is invalid
 
 def hash_data(data: Union[str, bytes]) -> str:
     """Hashes the input data using SHA-256 and returns the hex digest."""
@@ -99,12 +97,17 @@ class SIMDVector:
         
         return combined_hash
     
-    def visualize(self):
-        """Visualize all lanes with their colorful representations."""
-        print("SIMD Vector Visualization:")
-        for lane in self.lanes:
-            print(lane)
-        print(f"\nCombined Lane-wise XOR Hash: {self.lane_wise_xor()}")
+    def visualize(self, **render_options):
+        """Visualize all lanes with their colorful representations in one write."""
+        renderer = TreeRenderer(**render_options)
+
+        def label(lane: SIMDLane) -> str:
+            return f"Lane({lane.id}: {str(lane.data)[:20]})[{renderer.paint(lane.hash, width=6)}]"
+
+        renderer.line("SIMD Vector Visualization:")
+        renderer.items(self.lanes, label)
+        renderer.line(f"\nCombined Lane-wise XOR Hash: {self.lane_wise_xor()}")
+        renderer.flush()
 
 # Low-level SIMD-like Operations
 def lane_xor(hash1: str, hash2: str) -> str:
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+from main import ContentCache, snapshot_tree
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for rel in ("src/a.py", "src/b.py", "src/pkg/c.py", "tests/test_a.py"):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# {rel}\n")
+    return tmp_path
+
+
+def scan(cache, root):
+    digests = cache.digests(snapshot_tree([root / "src", root / "tests"]))
+    return digests, cache.directory_roots(digests)
+
+
+def record_clean(root, key="v1"):
+    cache = ContentCache(root)
+    digests, roots = scan(cache, root)
+    cache.record("ruff-check", key, dirs=roots, files=digests)
+    cache.save()
+
+
+def test_unchanged_tree_is_a_hit(tree):
+    record_clean(tree)
+    cache = ContentCache(tree)
+    digests, roots = scan(cache, tree)
+    clean = cache.clean("ruff-check", "v1")
+    assert clean["dirs"]["."] == roots["."]
+    assert cache.changed(digests, roots, clean) == []
+
+
+def test_one_changed_file_is_the_only_miss(tree):
+    record_clean(tree)
+    (tree / "src/pkg/c.py").write_text("# edited\n")
+    cache = ContentCache(tree)
+    digests, roots = scan(cache, tree)
+    clean = cache.clean("ruff-check", "v1")
+
+    assert cache.changed(digests, roots, clean) == ["src/pkg/c.py"]
+    # the edit moves the roots on its path only
+    assert roots["src/pkg"] != clean["dirs"]["src/pkg"]
+    assert roots["src"] != clean["dirs"]["src"]
+    assert roots["tests"] == clean["dirs"]["tests"]
+
+
+def test_new_and_deleted_files(tree):
+    record_clean(tree)
+    (tree / "tests/test_b.py").write_text("# new\n")
+    (tree / "src/b.py").unlink()
+    cache = ContentCache(tree)
+    digests, roots = scan(cache, tree)
+    assert cache.changed(digests, roots, cache.clean("ruff-check", "v1")) == ["tests/test_b.py"]
+    assert "src/b.py" not in cache.stats
+
+
+def test_key_mismatch_is_a_miss(tree):
+    record_clean(tree)
+    cache = ContentCache(tree)
+    digests, roots = scan(cache, tree)
+    clean = cache.clean("ruff-check", "v2")
+    assert clean == {}
+    assert cache.changed(digests, roots, clean) == sorted(digests)
+
+
+def test_touch_without_edit_keeps_the_digest(tree):
+    record_clean(tree)
+    path = tree / "src/a.py"
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    cache = ContentCache(tree)
+    digests, roots = scan(cache, tree)
+    assert cache.changed(digests, roots, cache.clean("ruff-check", "v1")) == []
+    assert cache.stats["src/a.py"][0] == st.st_mtime_ns + 1_000_000_000
@@ -0,0 +1,69 @@
+import asyncio
+import io
+import json
+
+import pytest
+
+import main
+from main import ForkServer, Job, ProjectManager
+
+pytestmark = pytest.mark.skipif(not ForkServer.supported(), reason="fork server needs POSIX fork and send_fds")
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = ProjectManager(tmp_path)
+    # short idle timeout so the server does not outlive the test run for long
+    manager._fork_server = ForkServer(tmp_path, [], idle_timeout=2)
+    return manager
+
+
+def test_concurrent_warm_jobs_on_a_cold_server(manager, tmp_path):
+    script = tmp_path / "job.py"
+    script.write_text("import sys; print('job', sys.argv[1])\n")
+    jobs = [Job(str(script), [str(i)], id=str(i)) for i in range(8)]
+    output = io.StringIO()
+
+    failed = asyncio.run(manager.run_many(jobs, concurrency=8, warm=True, output=output))
+
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert failed == 0, records
+    assert sorted(r["stdout"] for r in records) == sorted(f"job {i}\n" for i in range(8))
+    log = manager._fork_server.log_path
+    assert "Address already in use" not in (log.read_text() if log.exists() else "")
+
+
+def test_preload_skips_project_modules(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("open('imported', 'w').close()\n")
+    manager = ProjectManager(tmp_path)
+    preload = manager._preload_modules()
+    assert not any(name == "src" or name.startswith("src.") for name in preload)
+
+    manager._fork_server = ForkServer(tmp_path, preload, idle_timeout=2)
+    script = tmp_path / "probe.py"
+    script.write_text("import sys; print('app' in sys.modules, 'src' in sys.modules)\n")
+    output = io.StringIO()
+    failed = asyncio.run(manager.run_many([Job(str(script), [], id="0")], warm=True, output=output))
+    assert failed == 0
+    assert json.loads(output.getvalue())["stdout"] == "False False\n"
+    assert not (tmp_path / "imported").exists()
+
+
+def test_start_keeps_a_live_server(manager):
+    server = manager._fork_server
+    server.start()
+    inode = server.socket_path.stat().st_ino
+    server.start()  # a second start must not replace the listening socket
+    assert server.socket_path.stat().st_ino == inode
+    sock = server._connect()
+    assert sock is not None
+    sock.close()
+
+
+def test_socket_lives_in_a_private_directory(manager):
+    directory = manager._fork_server.socket_path.parent
+    assert directory.stat().st_mode & 0o777 == 0o700
+    assert main.os.stat(directory).st_uid == main.os.getuid()
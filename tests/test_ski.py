@@ -0,0 +1,87 @@
+import pytest
+
+from src import ski
+
+
+def normal_form(term, max_steps=None):
+    return ski.SKIMachine().normalize(term, max_steps)
+
+
+def test_skk_is_identity():
+    x = ski.free("x")
+    head, args = ski.unwind(normal_form(ski.app(ski.S, ski.K, ski.K, x)))
+    assert head is x and args == []
+
+
+def test_k_discards_second_argument():
+    x, y = ski.free("x"), ski.free("y")
+    assert ski.unwind(normal_form(ski.K(x, y))) == (x, [])
+
+
+def test_s_shares_its_argument():
+    f, g, x = ski.free("f"), ski.free("g"), ski.free("x")
+    head, args = ski.unwind(normal_form(ski.S(f, g, x)))
+    assert head is f and args[0] is x
+    inner_head, inner_args = ski.unwind(args[1])
+    assert inner_head is g and inner_args == [x]
+
+
+def test_deep_term_reduces_without_recursion():
+    x = ski.free("x")
+    term = x
+    for _ in range(100_000):
+        term = ski.I(term)
+    assert ski.unwind(normal_form(term)) == (x, [])
+
+
+def test_deep_left_spine():
+    # K x y1 ... yn with the K redexes nested down the spine: K (K (... (K x y) ...) y) y
+    x, y = ski.free("x"), ski.free("y")
+    term = x
+    for _ in range(50_000):
+        term = ski.K(term, y)
+    assert ski.unwind(normal_form(term)) == (x, [])
+
+
+def test_primitives_and_literals():
+    machine = ski.SKIMachine()
+    twice = ski.translate(r"\f x. f (f x)")
+    assert machine.evaluate(twice(ski.prim(lambda n: n + 1), 40)) == 42
+
+
+@pytest.mark.parametrize("source, expected", [
+    (r"\x. x", "I"),
+    (r"\x y. x", "K"),
+    (r"\f x. f x", "I"),  # eta-reduced
+])
+def test_bracket_abstraction(source, expected):
+    assert ski.show(ski.translate(source)) == expected
+
+
+def test_bracket_abstraction_behaves_like_lambda():
+    a, b = ski.free("a"), ski.free("b")
+    flip = ski.translate(r"\x y. y x")
+    head, args = ski.unwind(normal_form(flip(a, b)))
+    assert head is b and args == [a]
+
+
+def test_non_terminating_term_hits_step_limit():
+    omega = ski.translate(r"(\x. x x) (\x. x x)")
+    with pytest.raises(ski.ReductionLimitExceeded):
+        normal_form(omega, max_steps=1_000)
+
+
+def test_reduce_memoizes_by_structure():
+    machine = ski.SKIMachine()
+    x = ski.free("x")
+    first = machine.reduce(ski.app(ski.S, ski.K, ski.K, x))
+    steps = machine.steps
+    second = machine.reduce(ski.app(ski.S, ski.K, ski.K, x))
+    assert second is first and machine.steps == steps
+
+
+def test_parse_errors():
+    with pytest.raises(SyntaxError):
+        ski.parse_lambda(r"\x x")
+    with pytest.raises(SyntaxError):
+        ski.parse_lambda("(x")
@@ -0,0 +1,74 @@
+import os
+import tomllib
+
+from main import ProjectManager, dump_toml
+
+
+def test_dump_toml_round_trips_through_tomllib():
+    data = {
+        "title": 'quote " backslash \\ newline \n tab \t bell \x07',
+        "count": 3,
+        "ratio": 0.5,
+        "enabled": False,
+        "tags": ["a", "b"],
+        "project": {
+            "name": "demo",
+            "dependencies": ["ruff>=0.3.0"],
+            "urls": {"home page": "https://example.com"},
+        },
+        "tool": {"ruff": {"lint": {"select": ["E", "F"]}}},
+        "plugin": [{"name": "one", "options": {"level": 1}}, {"name": "two"}],
+    }
+    assert tomllib.loads(dump_toml(data)) == data
+
+
+def test_dump_toml_omits_none():
+    text = dump_toml({"project": {"name": "demo", "readme": None}, "missing": None})
+    assert tomllib.loads(text) == {"project": {"name": "demo"}}
+
+
+def test_dump_toml_keeps_empty_tables():
+    assert tomllib.loads(dump_toml({"tool": {"ruff": {}}})) == {"tool": {"ruff": {}}}
+
+
+def _set_name(path, old, new):
+    path.write_text(path.read_text().replace(f'name = "{old}"', f'name = "{new}"'))
+
+
+def test_config_snapshot_follows_pyproject_size_change(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pyproject = tmp_path / "pyproject.toml"
+    first = ProjectManager(tmp_path)
+    assert (tmp_path / ".demiurge" / "config.snapshot").exists()
+
+    _set_name(pyproject, first.config.name, "renamed-project")
+    assert ProjectManager(tmp_path).config.name == "renamed-project"
+
+
+def test_config_snapshot_follows_pyproject_mtime_change(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pyproject = tmp_path / "pyproject.toml"
+    ProjectManager(tmp_path)
+    _set_name(pyproject, tmp_path.name, "aaaa")
+    ProjectManager(tmp_path)
+    st = pyproject.stat()
+
+    # same size, different contents: only the mtime tells them apart
+    _set_name(pyproject, "aaaa", "bbbb")
+    assert pyproject.stat().st_size == st.st_size
+    os.utime(pyproject, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert ProjectManager(tmp_path).config.name == "bbbb"
+
+
+def test_config_snapshot_is_keyed_by_mtime_and_size(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pyproject = tmp_path / "pyproject.toml"
+    ProjectManager(tmp_path)
+    _set_name(pyproject, tmp_path.name, "aaaa")
+    ProjectManager(tmp_path)
+    st = pyproject.stat()
+
+    # an edit that keeps both mtime and size is not noticed: the snapshot is served
+    _set_name(pyproject, "aaaa", "bbbb")
+    os.utime(pyproject, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert ProjectManager(tmp_path).config.name == "aaaa"